@@ -1,31 +1,37 @@
 import sys
 import os
-import copy
+import errno
 import json
 import subprocess
+import threading
 import time
 import pty
 import shutil
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QWidget, QFileDialog, QLabel, QComboBox, QTextEdit, QGroupBox, QMessageBox,
+                             QWidget, QFileDialog, QLabel, QComboBox, QPlainTextEdit, QGroupBox, QMessageBox,
                              QLineEdit, QSizePolicy, QScrollArea, QFormLayout, QGridLayout, QCheckBox,
                              QFrame)
-from PyQt6.QtCore import Qt, QTimer, QSocketNotifier, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QTextCursor
 
 try:
     from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 except ImportError:
     from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+# Figure directly instead of pyplot: the canvases are embedded in Qt, so
+# pyplot's backend/state machinery is never needed.
+from matplotlib.figure import Figure
 import matplotlib.path as _mpath
 
 # Workaround: matplotlib.path.Path.__deepcopy__ is broken on Python 3.14+
-# (infinite recursion via copy.deepcopy(super(), memo)).
+# (infinite recursion via copy.deepcopy(super(), memo)). The app never
+# deep-copies plot state itself; matplotlib does internally (e.g. MarkerStyle).
 # Path is immutable — returning self is safe and breaks the recursion.
 def _path_deepcopy_fix(self, memo):
     memo[id(self)] = self
@@ -33,56 +39,247 @@ def _path_deepcopy_fix(self, memo):
 _mpath.Path.__deepcopy__ = _path_deepcopy_fix
 
 import re
+try:
+    # google-re2 matches in linear time, whatever spotread prints
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
 import numpy as np
-import colour
+# colour (colour-science) is the slowest import of the app (about half a
+# second), so it is imported inside the functions that need it.
+
+@lru_cache(maxsize=1)
+def _observer():
+    """Colour matching functions and illuminant used by sd_to_XYZ, resolved once.
+
+    sd_to_XYZ defaults to CIE Illuminant E; we keep it.
+    """
+    import colour
+    return colour.colorimetry.handle_spectral_arguments(illuminant_default="E")
+
+@lru_cache(maxsize=1)
+def _observer_arrays():
+    """_observer() arrays and normalisation for _sd_to_XYZ_1nm (360-780 nm, 1 nm grid)."""
+    cmfs, illuminant = _observer()
+    k = 100 / np.sum(cmfs.values[:, 1] * illuminant.values)
+    return cmfs.wavelengths, cmfs.values, illuminant.values, k
+
+# 1 nm interpolation targets, keyed by (start, end, interval)
+_SPECTRAL_SHAPES = {}
+
+def _spectral_shape(start, end, interval=1):
+    key = (start, end, interval)
+    shape = _SPECTRAL_SHAPES.get(key)
+    if shape is None:
+        import colour
+        shape = _SPECTRAL_SHAPES[key] = colour.SpectralShape(start, end, interval)
+    return shape
+
+def _sd_to_XYZ_1nm(wavelengths, values):
+    """colour.sd_to_XYZ(sd, *_observer()) for a spectrum on a whole-nm 1 nm grid.
+
+    That call reduces to this integration; values outside the measured
+    range are held at the end values, like colour's default extrapolation.
+    """
+    cmf_wl, cmf_values, illuminant_values, k = _observer_arrays()
+    R = np.interp(cmf_wl, wavelengths, values)
+    return k * np.dot(R * illuminant_values, cmf_values)
+
+def _read_text(path):
+    """Whole file as text (UTF-8, undecodable bytes replaced), read unbuffered.
+
+    One fstat sizes the read, so a spectrum file normally costs a single
+    read call; raises OSError like open().
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        size = os.fstat(fd).st_size + 1
+        while True:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode('utf-8', errors='replace')
+
+def _safe_float(token):
+    """float(token), or NaN when the token is not a number."""
+    try:
+        return float(token)
+    except ValueError:
+        return np.nan
+
+def build_argyll_env():
+    """os.environ with the common ArgyllCMS locations (Homebrew, manual installs, ...) prepended to PATH."""
+    env = os.environ.copy()
+    extra = ["/usr/local/bin", "/opt/homebrew/bin", "/usr/bin",
+             os.path.expanduser("~/bin")]
+    env["PATH"] = ":".join(extra) + ":" + env.get("PATH", "")
+    return env
+
+def resolve_spotread_command(env):
+    """Full path of spotread on env's PATH, or the bare name if it is not found."""
+    return shutil.which("spotread", path=env.get("PATH")) or "spotread"
+
+def _xyz_to_xy(X, Y, Z):
+    """Chromaticity (x, y) of an XYZ triple, or (None, None) when X+Y+Z <= 0."""
+    total = X + Y + Z
+    if total <= 0:
+        return None, None
+    return X / total, Y / total
+
+def _clip_xy(x, y):
+    """Clamp chromaticity to the CIE plot range (plain min/max, no ufunc call)."""
+    return min(max(x, 0.0), 0.8), min(max(y, 0.0), 0.9)
+
+# CIE 1931 2 degree spectral locus (xy, 380-780 nm every 5 nm), precomputed
+# from colour's observer so that drawing the CIE diagram needs no colour import
+_LOCUS_XY = np.array([
+    (0.174112, 0.004964), (0.174008, 0.004981), (0.173801, 0.004915), (0.173560, 0.004923),
+    (0.173337, 0.004797), (0.173021, 0.004775), (0.172577, 0.004799), (0.172087, 0.004833),
+    (0.171407, 0.005102), (0.170301, 0.005789), (0.168878, 0.006900), (0.166895, 0.008556),
+    (0.164412, 0.010858), (0.161105, 0.013793), (0.156641, 0.017705), (0.150985, 0.022740),
+    (0.143960, 0.029703), (0.135503, 0.039879), (0.124118, 0.057803), (0.109594, 0.086843),
+    (0.091294, 0.132702), (0.068706, 0.200723), (0.045391, 0.294976), (0.023460, 0.412703),
+    (0.008168, 0.538423), (0.003859, 0.654823), (0.013870, 0.750186), (0.038852, 0.812016),
+    (0.074302, 0.833803), (0.114161, 0.826207), (0.154722, 0.805864), (0.192876, 0.781629),
+    (0.229620, 0.754329), (0.265775, 0.724324), (0.301604, 0.692308), (0.337363, 0.658848),
+    (0.373102, 0.624451), (0.408736, 0.589607), (0.444062, 0.554714), (0.478775, 0.520202),
+    (0.512486, 0.486591), (0.544787, 0.454434), (0.575151, 0.424232), (0.602933, 0.396497),
+    (0.627037, 0.372491), (0.648233, 0.351395), (0.665764, 0.334011), (0.680079, 0.319747),
+    (0.691504, 0.308342), (0.700606, 0.299301), (0.707918, 0.292027), (0.714032, 0.285929),
+    (0.719033, 0.280935), (0.723032, 0.276948), (0.725992, 0.274008), (0.728272, 0.271728),
+    (0.729969, 0.270031), (0.731089, 0.268911), (0.731993, 0.268007), (0.732719, 0.267281),
+    (0.733417, 0.266583), (0.734047, 0.265953), (0.734390, 0.265610), (0.734592, 0.265408),
+    (0.734690, 0.265310), (0.734690, 0.265310), (0.734690, 0.265310), (0.734690, 0.265310),
+    (0.734690, 0.265310), (0.734690, 0.265310), (0.734690, 0.265310), (0.734690, 0.265310),
+    (0.734690, 0.265310), (0.734690, 0.265310), (0.734690, 0.265310), (0.734690, 0.265310),
+    (0.734690, 0.265310), (0.734690, 0.265310), (0.734690, 0.265310), (0.734690, 0.265310),
+    (0.734690, 0.265310),
+])
+
+def _compile(pattern):
+    """Compile a spotread parsing pattern with re2 when available, else re.
+
+    Patterns passed here must stay RE2-compatible: no backreferences or
+    lookaround.
+    """
+    return _re_engine.compile(pattern)
+
+# spotread output patterns, compiled once
+_RE_RESULT_XYZ = _compile(r"Result is XYZ:\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)")
+_RE_RESULT_YXY = _compile(r"Result is Yxy:\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)")
+# Conditions we react to, found in a single pass over the output:
+# ok = calibration done, dir = sensor in the wrong position.
+# Case-insensitive via (?i), which re and RE2 both accept: no lowercased copy.
+_RE_ISSUES = _compile(
+    r"(?i)(?P<ok>calibration\s+(?:successful|complete|ok)|calibrated\s+ok)"
+    r"|(?P<dir>wrong\s+position|sensor\s+should\s+be)")
+# The header is one line: [^,\n] / [^:\n] keep a stray "Radiometric spectrum"
+# from scanning the rest of the buffer for a comma or colon.
+_RE_SPECTRUM = _compile(
+    r"[Rr]adiometric\s+spectrum[^,\n]*,\s*(\d+)\s*nm\s+to\s+(\d+)\s*nm"
+    r"\s+at\s+(\d+)\s*nm\s+increments[^:\n]*:\s*\n([\d\.\s]+)")
+# spotread output kept for spectrum parsing (at least this many characters)
+_STDOUT_KEEP = 32768
+# How far back a PTY scan reaches before the new chunk (longer than a result line)
+_SCAN_OVERLAP = 128
+# Stays on re: RE2's \w is ASCII-only and would strip accented names
+_SANITIZE_RE = re.compile(r"[^\w\-]+")
+
+def _spotread_issue_flags(text):
+    """Names of the _RE_ISSUES groups that occur in text."""
+    flags = set()
+    for m in _RE_ISSUES.finditer(text):
+        flags.add(m.lastgroup)
+        if len(flags) == _RE_ISSUES.groups:
+            break
+    return flags
+
+@lru_cache(maxsize=8)
+def _cgats_header(start_nm, end_nm, step_nm):
+    """CGATS field names and wavelength axis for a spotread spectral range.
+
+    The range only changes with the instrument, so both are built once; the
+    returned array is read-only because it is shared between measurements.
+    """
+    wavelengths = np.arange(start_nm, end_nm + step_nm, step_nm, dtype=float)
+    wavelengths.setflags(write=False)
+    return " ".join(f"NM_{wl}" for wl in range(start_nm, end_nm + step_nm, step_nm)), wavelengths
+
+# Help text under the mode combo, keyed by spotread mode argument ("" = spot)
+_MODE_GUIDANCE = {
+    "-e": "Emission (-e): mesure écran/lumière directe. Capteur en position surface contre l'écran.",
+    "-a": "Ambient (-a): mesure lumière ambiante. Utilisez l'accessoire/diffuseur ambiant de la sonde si nécessaire.",
+    "-p": "Projector (-p): mode téléphoto si supporté (ColorMunki/i1Pro). Sinon préférez Emission (-e).",
+    "": "Spot (réflectance): mesure de surface réfléchissante.",
+}
+
+# Line-scanner states used by SpectrumPlotter.plot_spectrum
+_PARSE_IDLE, _PARSE_IN_FORMAT, _PARSE_IN_DATA = range(3)
+# Whitespace-delimited numeric tokens; stays on re because RE2 has no lookarounds
+_NUMERIC_TOKEN_RE = re.compile(r"(?<!\S)[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?(?!\S)")
+
+def _count_wavelength_tokens(line):
+    """Number of whitespace-separated tokens of line that are numbers in 300-830."""
+    tokens = _NUMERIC_TOKEN_RE.findall(line)
+    if not tokens:
+        return 0
+    values = np.array(tokens, dtype=np.float64)
+    return int(np.count_nonzero((values >= 300) & (values <= 830)))
+
+def _is_wavelength_header(parts, line):
+    """True when a line lists enough wavelengths to be a tabular export header."""
+    return len(parts) > 10 and _count_wavelength_tokens(line) > 10
+
+def _last_tabular_header_index(lines):
+    """Index of the last wavelength header line in lines, or 0 if there is none."""
+    for i in range(len(lines) - 1, -1, -1):
+        if _is_wavelength_header(lines[i].split(), lines[i]):
+            return i
+    return 0
 
 def wavelength_to_rgb(wavelength):
+    """Map wavelengths in nm (scalar or array) to RGB in [0, 1], shape (..., 3)."""
     gamma = 0.8
     intensity_max = 255
-    factor = 0.0
-    R = G = B = 0
-
-    if 380 <= wavelength < 440:
-        R = -(wavelength - 440) / (440 - 380)
-        G = 0.0
-        B = 1.0
-    elif 440 <= wavelength < 490:
-        R = 0.0
-        G = (wavelength - 440) / (490 - 440)
-        B = 1.0
-    elif 490 <= wavelength < 510:
-        R = 0.0
-        G = 1.0
-        B = -(wavelength - 510) / (510 - 490)
-    elif 510 <= wavelength < 580:
-        R = (wavelength - 510) / (580 - 510)
-        G = 1.0
-        B = 0.0
-    elif 580 <= wavelength < 645:
-        R = 1.0
-        G = -(wavelength - 645) / (645 - 580)
-        B = 0.0
-    elif 645 <= wavelength < 780:
-        R = 1.0
-        G = 0.0
-        B = 0.0
-    else:
-        R = G = B = 0.0
-
-    if 380 <= wavelength < 420:
-        factor = 0.3 + 0.7 * (wavelength - 380) / (420 - 380)
-    elif 420 <= wavelength < 645:
-        factor = 1.0
-    elif 645 <= wavelength < 780:
-        factor = 0.3 + 0.7 * (780 - wavelength) / (780 - 645)
-    else:
-        factor = 0.0
-
-    R = int(intensity_max * ((R * factor) ** gamma))
-    G = int(intensity_max * ((G * factor) ** gamma))
-    B = int(intensity_max * ((B * factor) ** gamma))
-
-    return (R / 255.0, G / 255.0, B / 255.0)
+    w = np.asarray(wavelength, dtype=float)
+    # Each channel and the edge fall-off are clipped linear ramps; one mask
+    # blanks everything outside the visible range [380, 780).
+    visible = (380 <= w) & (w < 780)
+    out = np.empty(w.shape + (3,))
+    np.maximum(np.clip((440 - w) / (440 - 380), 0, 1), np.clip((w - 510) / (580 - 510), 0, 1), out=out[..., 0])
+    np.clip(np.minimum((w - 440) / (490 - 440), (645 - w) / (645 - 580)), 0, 1, out=out[..., 1])
+    np.clip((510 - w) / (510 - 490), 0, 1, out=out[..., 2])
+
+    factor = np.clip(np.minimum(0.3 + 0.7 * (w - 380) / (420 - 380), 0.3 + 0.7 * (780 - w) / (780 - 645)), 0, 1)
+    factor *= visible
+
+    out *= factor[..., np.newaxis]
+    np.power(out, gamma, out=out)
+    out *= intensity_max
+    np.floor(out, out=out)  # int() truncation of the per-channel 0-255 value
+    out /= 255.0
+    return out
+
+@lru_cache(maxsize=32)
+def _spectrum_gradient(x_min, x_max):
+    """1x512 RGB image of the visible colours between x_min and x_max (nm).
+
+    Spectra from one instrument share their range, so this is built once per
+    range; the array is read-only because it is shared.
+    """
+    # A single row: the image only varies along x
+    grad_img = wavelength_to_rgb(np.linspace(x_min, x_max, 512))[np.newaxis, :, :]
+    grad_img.setflags(write=False)
+    return grad_img
+
+def _srgb_gamma(v):
+    if v > 0.0031308:
+        return 1.055 * (v ** (1 / 2.4)) - 0.055
+    return 12.92 * v
 
 def xyz_to_rgb(X, Y, Z):
     # Normalize assuming X, Y, Z are in 0-100 range (common in Argyll output)
@@ -94,56 +291,223 @@ def xyz_to_rgb(X, Y, Z):
     var_G = var_X * -0.9689 + var_Y *  1.8758 + var_Z *  0.0415
     var_B = var_X *  0.0557 + var_Y * -0.2040 + var_Z *  1.0570
 
-    def gamma_correct(v):
-        if v > 0.0031308:
-            return 1.055 * (v ** (1 / 2.4)) - 0.055
-        else:
-            return 12.92 * v
+    R = _srgb_gamma(var_R) * 255
+    G = _srgb_gamma(var_G) * 255
+    B = _srgb_gamma(var_B) * 255
 
-    R = gamma_correct(var_R) * 255
-    G = gamma_correct(var_G) * 255
-    B = gamma_correct(var_B) * 255
+    # Plain min/max: np.clip on Python scalars goes through the ufunc machinery
+    return int(min(max(R, 0), 255)), int(min(max(G, 0), 255)), int(min(max(B, 0), 255))
 
-    return int(np.clip(R, 0, 255)), int(np.clip(G, 0, 255)), int(np.clip(B, 0, 255))
+@lru_cache(maxsize=512)
+def xy_to_patch_hex(x, y):
+    """Display colour of a chromaticity at Y = 100, as '#rrggbb' (None if undefined).
+
+    Memoized: history reloads and older entries without 'patch_hex' hit the
+    same (x, y) pairs again.
+    """
+    if x is None or y is None or y <= 0:
+        return None
+    r, g, b = xyz_to_rgb(x / y * 100.0, 100.0, (1.0 - x - y) / y * 100.0)
+    return f"#{r:02x}{g:02x}{b:02x}"
 
 def yxy_to_xyz(Y, x, y):
     if y == 0:
         return 0.0, 0.0, 0.0
-    X = x * (Y / y)
-    Z = (1 - x - y) * (Y / y)
-    return X, Y, Z
+    scale = Y / y
+    return x * scale, Y, (1 - x - y) * scale
+
+def spectrum_colorimetry(longueur_onde, intensité):
+    """XYZ, Lab, display RGB and CRI of a parsed spectrum, as a dict."""
+    import colour
+    # Create Spectral Distribution straight from the arrays
+    # Ensure wavelengths are sorted and unique
+    wl_sorted, first = np.unique(longueur_onde, return_index=True)
+    int_sorted = intensité[first]
+
+    sd = colour.SpectralDistribution(int_sorted, wl_sorted, name='Sample')
+
+    # Interpolate to standard 1nm interval for colour-science
+    # This fixes the "measurement interval" error for irregular data (e.g. 3.3nm from i1Pro)
+    # Data already on a whole-nm 1nm grid is left as is.
+    if not (wl_sorted[0] == int(wl_sorted[0]) and np.allclose(np.diff(wl_sorted), 1.0)):
+        sd.interpolate(_spectral_shape(sd.shape.start, sd.shape.end, 1))
+
+    # Calculate XYZ (CIE 1931 2 Degree Standard Observer)
+    if sd.shape.start == int(sd.shape.start):
+        XYZ = _sd_to_XYZ_1nm(sd.wavelengths, sd.values)
+    else:
+        cmfs, illuminant = _observer()
+        XYZ = colour.sd_to_XYZ(sd, cmfs=cmfs, illuminant=illuminant)
+
+    # Calculate Lab (using D65 as reference)
+    # colour.XYZ_to_Lab expects XYZ in domain [0, 1] usually (relative to reference white Y=1)
+    Lab = colour.XYZ_to_Lab(XYZ / 100.0)
+
+    # Calculate sRGB
+    # XYZ_to_sRGB expects XYZ in domain [0, 1] usually.
+    RGB = colour.XYZ_to_sRGB(XYZ / 100.0)
+
+    # Calculate CRI
+    cri_res = colour.quality.colour_rendering_index(sd, additional_data=True)
+
+    # Plain floats and ints: the result is also stored in colorimetry_cache.json
+    return {
+        "XYZ": [float(v) for v in XYZ],
+        "Lab": [float(v) for v in Lab],
+        "RGB": [int(np.clip(c, 0, 1) * 255) for c in RGB],
+        "Ra": float(cri_res.Q_a),
+        "R": {int(k): float(v.Q_a) for k, v in cri_res.Q_as.items()},
+    }
+
+# Entries kept in colorimetry_cache.json (least recently used dropped first)
+_COLORIMETRY_CACHE_MAX = 500
+
 
+class ColorimetrySignals(QObject):
+    result_ready = pyqtSignal(int, object)  # job number, spectrum_colorimetry dict or the exception
 
-class InstrumentEnumeratorThread(QThread):
-    """Runs `spotread -?` and parses the instrument list."""
+
+class ColorimetryTask(QRunnable):
+    """Runs spectrum_colorimetry on a pool thread; the CRI alone takes tens of ms."""
+
+    def __init__(self, job, longueur_onde, intensité):
+        super().__init__()
+        self.signals = ColorimetrySignals()
+        self.setAutoDelete(False)
+        self.job = job
+        self.longueur_onde = longueur_onde
+        self.intensité = intensité
+
+    def run(self):
+        try:
+            result = spectrum_colorimetry(self.longueur_onde, self.intensité)
+        except Exception as e:
+            result = e
+        self.signals.result_ready.emit(self.job, result)
+
+
+def _run_spotread(args, env, timeout_s, on_line):
+    """Run spotread (stdout and stderr merged), passing each output line to
+    on_line as it arrives. Returns True if it was killed after timeout_s.
+
+    spotread is always killed and reaped before returning, also when reading
+    its output fails.
+    """
+    proc = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        stdin=subprocess.DEVNULL,
+        env=env,
+        bufsize=1,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    # The timer kills spotread if it hangs
+    timed_out = threading.Event()
+
+    def _kill():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout_s, _kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            on_line(line)
+        proc.wait()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+        # Stopped reading early (exception): do not leave spotread running
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+    return timed_out.is_set()
+
+
+class InstrumentScanSignals(QObject):
+    cached_instruments = pyqtSignal(dict) # last scan's list, shown until the live one arrives
     instruments_found = pyqtSignal(dict)  # {index(int): name(str)}
     debug_output      = pyqtSignal(str)   # raw spotread output for debugging
 
+
+class InstrumentScanTask(QRunnable):
+    """Runs `spotread -?` on a pool thread and parses the instrument list."""
+
+    def __init__(self, env, cmd, cache_file=None, use_cache=True):
+        super().__init__()
+        # Created in the GUI thread, so emits from the pool thread are queued
+        self.signals = InstrumentScanSignals()
+        self.setAutoDelete(False)  # the window keeps a reference until done
+        self.env = env
+        self.cmd = cmd
+        # JSON file holding the last successful scan; None disables the cache.
+        # The scan always runs: the cached list (use_cache=True) is only a
+        # placeholder, since it describes what was plugged in last time.
+        self.cache_file = cache_file
+        self.use_cache = use_cache
+
+    def _binary_key(self):
+        """Identifies the installed spotread binary: resolved path + mtime."""
+        if not os.path.isabs(self.cmd):
+            return None
+        try:
+            return f"{os.path.realpath(self.cmd)}:{os.stat(self.cmd).st_mtime_ns}"
+        except OSError:
+            return None
+
+    def _read_cache(self, binary_key):
+        if self.cache_file is None or binary_key is None or not self.use_cache:
+            return None
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("binary_key") != binary_key:
+                return None
+            instruments = {int(k): str(v) for k, v in data.get("instruments", {}).items()}
+            return (data.get("raw_head", ""), instruments) if instruments else None
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _write_cache(self, binary_key, instruments, raw):
+        if self.cache_file is None or binary_key is None or not instruments:
+            return
+        text = json.dumps({"binary_key": binary_key,
+                           "instruments": instruments,
+                           "raw_head": raw[:4096]}, separators=(",", ":"), ensure_ascii=False)
+        # Rescanning the same setup gives the same file: leave it alone
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                if f.read() == text:
+                    return
+        except OSError:
+            pass
+        tmp = f"{self.cache_file}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, self.cache_file)
+        except OSError:
+            pass
+
     def run(self):
         instruments = {}
         raw = ""
 
-        try:
-            # Add common ArgyllCMS paths on macOS (Homebrew, manual installs, etc.)
-            env = os.environ.copy()
-            extra = ["/usr/local/bin", "/opt/homebrew/bin", "/usr/bin",
-                     os.path.expanduser("~/bin")]
-            env["PATH"] = ":".join(extra) + ":" + env.get("PATH", "")
-
-            proc = subprocess.run(
-                ["spotread", "-?"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,  # merge stderr so we catch either stream
-                stdin=subprocess.DEVNULL,
-                env=env,
-                timeout=20,
-            )
-            raw = proc.stdout.decode("utf-8", errors="replace")
+        # Same binary as last time: show its instrument list while scanning
+        binary_key = self._binary_key()
+        cached = self._read_cache(binary_key)
+        if cached is not None:
+            self.signals.cached_instruments.emit(cached[1])
 
-        except subprocess.TimeoutExpired as e:
+        try:
+            parts = []
+            timed_out = _run_spotread([self.cmd, "-?"], self.env, 20, parts.append)
             # Keep partial output if spotread takes too long.
-            raw = e.stdout.decode("utf-8", errors="replace") if e.stdout else ""
-            if not raw:
+            raw = "".join(parts)
+            if timed_out and not raw:
                 raw = "[spotread -? a expiré sans produire de sortie — vérifiez ArgyllCMS]"
         except FileNotFoundError:
             raw = "[spotread non trouvé — ArgyllCMS installé et dans le PATH ?]"
@@ -152,42 +516,59 @@ class InstrumentEnumeratorThread(QThread):
 
         # Parse all instrument lines globally. This is robust even if the
         # help text layout changes or wraps differently between Argyll versions.
-        for m in re.finditer(r"(?m)^\s*(\d+)\s*=\s*'([^']+)'\s*$", raw):
-            instruments[int(m.group(1))] = m.group(2)
-
-        self.debug_output.emit(raw)
-        self.instruments_found.emit(instruments)
+        # Entries are <index> = 'name' ("name" or a bare name also accepted).
+        for line in raw.splitlines():
+            left, eq, right = line.partition("=")
+            if not eq:
+                continue
+            left = left.strip()
+            if not left.isdigit():
+                continue
+            name = right.strip().strip("'\"")
+            if name:
+                instruments[int(left)] = name
+
+        self._write_cache(binary_key, instruments, raw)
+        self.signals.debug_output.emit(raw)
+        self.signals.instruments_found.emit(instruments)
+
+
+class SpotreadOneShotSignals(QObject):
+    output_ready = pyqtSignal(str, bool)  # raw output, calibration_only
+    progress     = pyqtSignal(str)        # each output line as it arrives
+    finished     = pyqtSignal()
 
 
-class SpotreadOneShotThread(QThread):
-    """Runs a one-shot spotread command outside the UI thread."""
-    output_ready = pyqtSignal(str, bool)  # raw output, calibration_only
+class SpotreadOneShotTask(QRunnable):
+    """Runs a one-shot spotread command on a pool thread, outside the UI thread."""
 
     def __init__(self, args, env, timeout_s=120, calibration_only=False):
         super().__init__()
-        self.args = args
-        self.env = env
+        self.signals = SpotreadOneShotSignals()
+        self.setAutoDelete(False)
+        self.args = tuple(args)
+        self.env = env  # shared with the window, read-only here
         self.timeout_s = timeout_s
         self.calibration_only = calibration_only
 
     def run(self):
+        parts = []
+
+        # Stream lines to the UI as they arrive
+        def _on_line(line):
+            parts.append(line)
+            self.signals.progress.emit(line)
+
         try:
-            proc = subprocess.run(
-                self.args,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                stdin=subprocess.DEVNULL,
-                env=self.env,
-                timeout=self.timeout_s,
-            )
-            raw = proc.stdout.decode("utf-8", errors="replace")
-        except subprocess.TimeoutExpired as e:
-            raw = e.stdout.decode("utf-8", errors="replace") if e.stdout else ""
-            raw += "\n[Erreur: spotread a expiré]"
+            if _run_spotread(self.args, self.env, self.timeout_s, _on_line):
+                parts.append("\n[Erreur: spotread a expiré]")
+                self.signals.progress.emit(parts[-1])
         except Exception as e:
-            raw = f"[Erreur spotread one-shot: {e}]"
+            parts.append(f"[Erreur spotread one-shot: {e}]")
+            self.signals.progress.emit(parts[-1])
 
-        self.output_ready.emit(raw, self.calibration_only)
+        self.signals.output_ready.emit("".join(parts), self.calibration_only)
+        self.signals.finished.emit()
 
 
 class SpectrumPlotter(QMainWindow):
@@ -253,7 +634,7 @@ class SpectrumPlotter(QMainWindow):
                 padding: 6px;
                 min-height: 30px;
             }
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #ffffff;
                 border: 1px solid #d3dce6;
                 border-radius: 8px;
@@ -275,6 +656,101 @@ class SpectrumPlotter(QMainWindow):
                 padding: 0 6px;
                 color: #334e68;
             }
+            QLabel#modeHelp {
+                color: #444;
+                font-size: 11px;
+                padding: 2px;
+            }
+            QLabel#sessionStatus {
+                background-color: #eef4ff;
+                color: #1f4ea3;
+                border: 1px solid #c9daf9;
+                border-radius: 6px;
+                padding: 6px;
+            }
+            QPushButton#startBtn {
+                background-color: #27ae60;
+                min-height: 34px;
+                font-weight: bold;
+            }
+            QPushButton#startBtn:hover:!disabled {
+                background-color: #1e8449;
+            }
+            QPushButton#startBtn:disabled {
+                background-color: #a9dfbf;
+            }
+            QPushButton#stopBtn {
+                background-color: #c0392b;
+                min-height: 34px;
+                font-weight: bold;
+            }
+            QPushButton#stopBtn:hover:!disabled {
+                background-color: #a93226;
+            }
+            QPushButton#stopBtn:disabled {
+                background-color: #f1948a;
+            }
+            QLabel#calibStatus {
+                color: #c0392b;
+                font-weight: bold;
+                padding: 4px;
+            }
+            QLabel#calibStatus[state="ok"] {
+                color: #27ae60;
+            }
+            QPlainTextEdit#console {
+                background-color: #1e1e1e;
+                color: #00ff00;
+                font-family: 'Menlo', 'Courier New', monospace;
+            }
+            QLabel#colorPatch {
+                background-color: gray;
+                border: 1px solid #9aa5b1;
+                border-radius: 5px;
+            }
+            QLabel#colorValues, QLabel#criDetailsLabel {
+                font-size: 11px;
+            }
+            QLabel#criLabel {
+                font-weight: bold;
+                font-size: 13px;
+            }
+            QPlainTextEdit#criDetails {
+                font-family: 'Menlo', 'Courier New', monospace;
+                font-size: 10px;
+            }
+            QLabel#cieValue {
+                font-weight: 600;
+                color: #334e68;
+            }
+            QLabel#recentHint {
+                color: #486581;
+            }
+            QLabel#recentEmpty {
+                color: #829ab1;
+                padding: 8px;
+            }
+            QFrame#recentCard, QFrame#recentCard QFrame {
+                background: #f7f9fc;
+                border: 1px solid #d8e1ec;
+                border-radius: 8px;
+            }
+            QLabel#cardName {
+                font-weight: 600;
+                color: #243b53;
+            }
+            QLabel#cardMeta, QLabel#cardXy {
+                font-size: 11px;
+            }
+            QLabel#cardMeta {
+                color: #627d98;
+            }
+            QLabel#cardXy {
+                color: #486581;
+            }
+            QLabel#cardPatch {
+                border-radius: 4px;
+            }
         """)
 
         self.central_widget = QWidget()
@@ -319,7 +795,7 @@ class SpectrumPlotter(QMainWindow):
         self.refresh_instr_btn.setObjectName("secondaryButton")
         self.refresh_instr_btn.setFixedSize(34, 34)
         self.refresh_instr_btn.setToolTip("Actualiser la liste des instruments")
-        self.refresh_instr_btn.clicked.connect(self.enumerate_instruments)
+        self.refresh_instr_btn.clicked.connect(self._enumerate_instruments_debounced)
         instr_row_layout.addWidget(self.refresh_instr_btn)
         form.addRow("Instrument :", instr_row_widget)
 
@@ -348,15 +824,12 @@ class SpectrumPlotter(QMainWindow):
 
         self.mode_help_label = QLabel("")
         self.mode_help_label.setWordWrap(True)
-        self.mode_help_label.setStyleSheet("color: #444; font-size: 11px; padding: 2px;")
+        self.mode_help_label.setObjectName("modeHelp")
         controls_outer.addWidget(self.mode_help_label)
 
         self.session_status_label = QLabel("État : prêt")
         self.session_status_label.setWordWrap(True)
-        self.session_status_label.setStyleSheet(
-            "background-color: #eef4ff; color: #1f4ea3; border: 1px solid #c9daf9; "
-            "border-radius: 6px; padding: 6px;"
-        )
+        self.session_status_label.setObjectName("sessionStatus")
         controls_outer.addWidget(self.session_status_label)
 
         # --- Dossier de sauvegarde (inline) ---
@@ -379,11 +852,7 @@ class SpectrumPlotter(QMainWindow):
 
         self.start_btn = QPushButton("▶  Démarrer Session")
         self.start_btn.clicked.connect(self.start_session)
-        self.start_btn.setStyleSheet(
-            "QPushButton { background-color: #27ae60; min-height: 34px; font-weight: bold; }"
-            "QPushButton:hover:!disabled { background-color: #1e8449; }"
-            "QPushButton:disabled { background-color: #a9dfbf; }"
-        )
+        self.start_btn.setObjectName("startBtn")
         self.start_btn.setVisible(False)
 
         self.calibrate_btn = QPushButton("⚙  Calibrer")
@@ -401,26 +870,27 @@ class SpectrumPlotter(QMainWindow):
         self.stop_btn = QPushButton("■  Arrêter Session")
         self.stop_btn.clicked.connect(self.stop_session)
         self.stop_btn.setEnabled(False)
-        self.stop_btn.setStyleSheet(
-            "QPushButton { background-color: #c0392b; min-height: 34px; font-weight: bold; }"
-            "QPushButton:hover:!disabled { background-color: #a93226; }"
-            "QPushButton:disabled { background-color: #f1948a; }"
-        )
+        self.stop_btn.setObjectName("stopBtn")
         self.stop_btn.setVisible(False)
 
         controls_outer.addLayout(btn_grid)
 
         # Calibration status indicator
         self.calib_status_label = QLabel("🔴  Non calibré")
+        self.calib_status_label.setObjectName("calibStatus")
         self.calib_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.calib_status_label.setStyleSheet("color: #c0392b; font-weight: bold; padding: 4px;")
         controls_outer.addWidget(self.calib_status_label)
 
         self.left_layout.addWidget(self.controls_group)
 
-        self.mode_combo.currentIndexChanged.connect(self._update_mode_guidance)
-        self._oneshot_thread = None
+        self._oneshot_task = None
         self._oneshot_busy = False
+        self._deferred_oneshot = None  # (calibration_only, instrument) waiting for a scan to end
+        # Selected mode, cached on change: spotread argument and banner label
+        self._current_mode_arg = ""
+        self._current_mode_label = "-"
+        self.mode_combo.currentIndexChanged.connect(self._on_mode_changed)
+        self._cache_current_mode()
         self._update_mode_guidance()
         self._update_execution_mode_ui()
 
@@ -429,12 +899,22 @@ class SpectrumPlotter(QMainWindow):
         self.console_group.setCheckable(False)
         console_layout = QVBoxLayout()
         console_layout.setSpacing(6)
-        self.console_output = QTextEdit()
+        self.console_output = QPlainTextEdit()
         self.console_output.setReadOnly(True)
+        # Log-style console: plain-text layout, oldest lines dropped past the cap.
+        self.console_output.setMaximumBlockCount(5000)
         self.console_output.setMinimumHeight(140)
         self.console_output.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.MinimumExpanding)
-        self.console_output.setStyleSheet("background-color: #1e1e1e; color: #00ff00; font-family: 'Menlo', 'Courier New', monospace;")
+        self.console_output.setObjectName("console")
         console_layout.addWidget(self.console_output)
+        # PTY chunks and _log lines share one queue, flushed at most every 50 ms:
+        # a spectral dump costs one relayout/repaint, not one per read or line.
+        # Nothing else writes to the console, so the order is always preserved.
+        self._console_pending = []
+        self._console_flush_timer = QTimer(self)
+        self._console_flush_timer.setSingleShot(True)
+        self._console_flush_timer.setInterval(50)
+        self._console_flush_timer.timeout.connect(self._flush_console)
         clear_console_btn = QPushButton("Effacer console")
         clear_console_btn.setObjectName("secondaryButton")
         clear_console_btn.clicked.connect(self.console_output.clear)
@@ -453,31 +933,31 @@ class SpectrumPlotter(QMainWindow):
         self.color_patch = QLabel()
         self.color_patch.setFixedHeight(18)
         self.color_patch.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.color_patch.setStyleSheet("background-color: gray; border: 1px solid #9aa5b1; border-radius: 5px;")
+        self.color_patch.setObjectName("colorPatch")
         self.color_layout.addWidget(self.color_patch)
 
         self.color_values_label = QLabel("XYZ: - - -\nRGB: - - -\nLab: - - -")
         self.color_values_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.color_values_label.setStyleSheet("font-size: 11px;")
+        self.color_values_label.setObjectName("colorValues")
         self.color_values_label.setVisible(False)
         self.color_layout.addWidget(self.color_values_label)
 
         self.cri_label = QLabel("CRI (Ra): -")
         self.cri_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.cri_label.setStyleSheet("font-weight: bold; font-size: 13px;")
+        self.cri_label.setObjectName("criLabel")
         self.cri_label.setVisible(False)
         self.color_layout.addWidget(self.cri_label)
 
         self.cri_details_label = QLabel("R9-R15:")
-        self.cri_details_label.setStyleSheet("font-size: 11px;")
+        self.cri_details_label.setObjectName("criDetailsLabel")
         self.cri_details_label.setVisible(False)
         self.color_layout.addWidget(self.cri_details_label)
 
-        self.cri_details = QTextEdit()
+        self.cri_details = QPlainTextEdit()
         self.cri_details.setReadOnly(True)
         self.cri_details.setMaximumHeight(120)
-        self.cri_details.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
-        self.cri_details.setStyleSheet("font-family: 'Menlo', 'Courier New', monospace; font-size: 10px;")
+        self.cri_details.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.cri_details.setObjectName("criDetails")
         self.cri_details.setPlainText("XYZ: -\nRGB: -\nLab: -\nCRI (Ra): -")
         self.color_layout.addWidget(self.cri_details)
         self.color_group.setMaximumHeight(180)
@@ -495,7 +975,7 @@ class SpectrumPlotter(QMainWindow):
         self.spectrum_group = QGroupBox("Spectre")
         spectrum_layout = QVBoxLayout(self.spectrum_group)
         spectrum_layout.setContentsMargins(2, 2, 2, 2)
-        self.canvas = FigureCanvas(plt.Figure(figsize=(6.2, 6.2), dpi=100))
+        self.canvas = FigureCanvas(Figure(figsize=(6.2, 6.2), dpi=100))
         self.canvas.setMinimumSize(440, 440)
         self.canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         spectrum_layout.addWidget(self.canvas)
@@ -504,14 +984,14 @@ class SpectrumPlotter(QMainWindow):
         self.cie_group = QGroupBox("CIE 1931 xy")
         cie_layout = QVBoxLayout(self.cie_group)
         cie_layout.setContentsMargins(3, 3, 3, 3)
-        self.cie_canvas = FigureCanvas(plt.Figure(figsize=(4.2, 4.2), dpi=100))
+        self.cie_canvas = FigureCanvas(Figure(figsize=(4.2, 4.2), dpi=100))
         self.cie_canvas.setMinimumSize(240, 240)
         self.cie_canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         cie_layout.addWidget(self.cie_canvas)
 
         self.cie_value_label = QLabel("x: -   y: -")
         self.cie_value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.cie_value_label.setStyleSheet("font-weight: 600; color: #334e68;")
+        self.cie_value_label.setObjectName("cieValue")
         cie_layout.addWidget(self.cie_value_label)
         self.cie_group.setMaximumHeight(330)
 
@@ -534,7 +1014,7 @@ class SpectrumPlotter(QMainWindow):
         recent_header = QHBoxLayout()
         recent_header.setSpacing(6)
         self.recent_hint_label = QLabel("Clique une mesure pour recharger")
-        self.recent_hint_label.setStyleSheet("color: #486581;")
+        self.recent_hint_label.setObjectName("recentHint")
         recent_header.addWidget(self.recent_hint_label, 1)
         recent_layout.addLayout(recent_header)
 
@@ -566,39 +1046,86 @@ class SpectrumPlotter(QMainWindow):
         self.recent_row.setContentsMargins(4, 4, 4, 4)
         self.recent_row.setSpacing(8)
         self.recent_scroll.setWidget(self.recent_container)
+        self._build_recent_cards()
         self.recent_body.addWidget(self.recent_scroll, 1)
         recent_layout.addLayout(self.recent_body)
         self.right_layout.addWidget(self.recent_group)
 
         self.ax = self.canvas.figure.subplots()
+        self._spectrum_bg = None
+        self._spectrum_view = None
+        # Axes and artists are built once; each plot only updates their data
+        self._init_spectrum_axes()
         self.cie_ax = self.cie_canvas.figure.subplots()
+        # CIE point is blitted over a cached background (locus, grid, labels)
+        self._cie_bg = None
+        self.cie_canvas.mpl_connect('draw_event', self._on_cie_draw)
 
         # Process Handling
         self.subprocess = None
         self.master_fd = None
-        self.notifier = None
+        # The PTY is polled every 50 ms rather than watched with a
+        # QSocketNotifier, which can keep waking the event loop while the fd
+        # stays readable. Each tick drains everything available.
+        self._pty_timer = QTimer(self)
+        self._pty_timer.setInterval(50)
+        self._pty_timer.timeout.connect(self._drain_pty)
         
         self.temp_file = "temp_measure.sp"
         self.base_save_dir = Path.cwd() / "mesures"
         self.base_save_dir.mkdir(parents=True, exist_ok=True)
         self.save_folder_input.setText(str(self.base_save_dir))
         self.last_saved_mtime = None
-        self.recent_history_file = self.base_save_dir / "recent_measurements.json"
+        self.recent_history_file = self.base_save_dir / "recent_measurements.ndjson"
         self.recent_measurements = []
+        self._recent_history_lines = 0
+        self.instrument_cache_file = self.base_save_dir / "instrument_cache.json"
+        # spectrum_colorimetry results of opened files, by _colorimetry_key
+        self.colorimetry_cache_file = self.base_save_dir / "colorimetry_cache.json"
+        self._colorimetry_cache = None  # read from the file on first use
+        # Coalesces cache updates into one file write; closeEvent writes what is left
+        self._colorimetry_save_timer = QTimer(self)
+        self._colorimetry_save_timer.setSingleShot(True)
+        self._colorimetry_save_timer.setInterval(5000)
+        self._colorimetry_save_timer.timeout.connect(self._save_colorimetry_cache)
         self._cie_point_artist = None
 
         # --- Session state ---
         self._calibrated = False
-        self._stdout_buf = ""
+        # spotread output as a deque of chunks; see _stdout_append / _stdout_text
+        self._stdout_reset()
         self._pending_result = False
-        self._last_xyz = (0.0, 0.0, 0.0)
-        self._instr_thread = None
-
-        # Enumerate instruments at startup
-        self._init_cie_plot()
+        self._last_xyz = None  # (X, Y, Z) of the latest 'Result is' line
+        self._last_spectrum = None  # (wavelengths, values) of the last parsed file
+        self._instr_task = None
+        # Instrument list shown in the combo, as frozenset(instruments.items());
+        # None while the combo shows "Recherche..." instead of a scan result
+        self._instruments_key = None
+        # Scans, one-shot measurements and colorimetry run on three long-lived
+        # pool threads (at most one scan and one measurement at a time)
+        # instead of a new QThread per run.
+        self._worker_pool = QThreadPool(self)
+        self._worker_pool.setMaxThreadCount(3)
+        # (task, cache key) of colorimetry in flight by job number; only the
+        # latest job is shown
+        self._colorimetry_tasks = {}
+        self._colorimetry_job = 0
+        self._worker_pool.setExpiryTimeout(-1)
+        # Coalesces refresh clicks into a single spotread scan
+        self._instr_debounce_timer = QTimer(self)
+        self._instr_debounce_timer.setSingleShot(True)
+        self._instr_debounce_timer.setInterval(500)
+        self._instr_debounce_timer.timeout.connect(self.enumerate_instruments)
+        # Built once: it only depends on os.environ, which the app never changes
+        self._argyll_env = build_argyll_env()
+        self._rescan_argyll_env()
+
+        # Enumerate instruments at startup (last known list if spotread is unchanged).
+        # The CIE diagram is built on the first event-loop pass, after the window is up.
+        QTimer.singleShot(0, self._init_cie_plot)
         self._load_recent_measurements()
         self._refresh_recent_carousel()
-        self.enumerate_instruments()
+        self.enumerate_instruments(use_cache=True)
         self._update_status_banner()
 
     def _init_cie_plot(self):
@@ -612,69 +1139,122 @@ class SpectrumPlotter(QMainWindow):
         self.cie_ax.set_box_aspect(1)
         self.cie_ax.grid(True, alpha=0.25)
 
-        try:
-            cmfs = colour.MSDS_CMFS["CIE 1931 2 Degree Standard Observer"].copy()
-            cmfs = cmfs.align(colour.SpectralShape(380, 780, 5))
-            locus_xy = colour.XYZ_to_xy(cmfs.values)
-            self.cie_ax.plot(locus_xy[..., 0], locus_xy[..., 1], color="#334e68", linewidth=1.2)
-            if len(locus_xy) > 0:
-                self.cie_ax.plot([locus_xy[-1, 0], locus_xy[0, 0]], [locus_xy[-1, 1], locus_xy[0, 1]], color="#334e68", linewidth=1.2)
-        except Exception as exc:
-            self.console_output.append(f"Erreur tracé CIE: {exc}")
+        locus_xy = _LOCUS_XY
+        self.cie_ax.plot(locus_xy[..., 0], locus_xy[..., 1], color="#334e68", linewidth=1.2)
+        # Purple line closing the locus
+        self.cie_ax.plot([locus_xy[-1, 0], locus_xy[0, 0]], [locus_xy[-1, 1], locus_xy[0, 1]], color="#334e68", linewidth=1.2)
 
-        self._cie_point_artist = self.cie_ax.scatter([0.33], [0.33], s=65, color="#2f6fda", edgecolors="black", zorder=5)
+        self._cie_point_artist = self.cie_ax.scatter([0.33], [0.33], s=65, color="#2f6fda", edgecolors="black", zorder=5,
+                                                     animated=True)
+        self._cie_bg = None
         self.cie_canvas.figure.subplots_adjust(left=0.10, right=0.98, bottom=0.10, top=0.93)
         self.cie_canvas.draw_idle()
 
+    def _on_cie_draw(self, event):
+        """After every full draw (first show, resize), cache the background and paint the point."""
+        if self._cie_point_artist is None:
+            return
+        self._cie_bg = self.cie_canvas.copy_from_bbox(self.cie_ax.bbox)
+        self.cie_ax.draw_artist(self._cie_point_artist)
+
     def _update_cie_point(self, X: float, Y: float, Z: float):
-        total = X + Y + Z
-        if total <= 0:
+        x, y = _xyz_to_xy(X, Y, Z)
+        if x is None:
             self.cie_value_label.setText("x: -   y: -")
             return
 
-        x = X / total
-        y = Y / total
-        x = float(np.clip(x, 0.0, 0.8))
-        y = float(np.clip(y, 0.0, 0.9))
+        x, y = _clip_xy(float(x), float(y))
 
         r, g, b = xyz_to_rgb(X, Y, Z)
         marker_color = (r / 255.0, g / 255.0, b / 255.0)
         if self._cie_point_artist is None:
-            self._cie_point_artist = self.cie_ax.scatter([x], [y], s=65, color=marker_color, edgecolors="black", zorder=5)
+            self._cie_point_artist = self.cie_ax.scatter([x], [y], s=65, color=marker_color, edgecolors="black", zorder=5,
+                                                         animated=True)
         else:
             self._cie_point_artist.set_offsets(np.array([[x, y]]))
             self._cie_point_artist.set_color([marker_color])
 
         self.cie_value_label.setText(f"x: {x:.4f}   y: {y:.4f}")
-        self.cie_canvas.draw_idle()
+        if self._cie_bg is None:
+            self.cie_canvas.draw_idle()
+            return
+        self.cie_canvas.restore_region(self._cie_bg)
+        self.cie_ax.draw_artist(self._cie_point_artist)
+        self.cie_canvas.blit(self.cie_ax.bbox)
 
     def _load_recent_measurements(self):
+        """Read the history log (one JSON entry per line, oldest first).
+
+        A path added again appears several times; its latest line wins. A
+        history saved by older versions as a JSON list is converted once.
+        """
         self.recent_measurements = []
+        self._recent_history_lines = 0
+        legacy_file = self.recent_history_file.with_suffix(".json")
         if not self.recent_history_file.exists():
+            if legacy_file.exists():
+                try:
+                    with open(legacy_file, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    if isinstance(data, list):
+                        self.recent_measurements = [
+                            item for item in data
+                            if isinstance(item, dict) and item.get("path") and Path(item["path"]).exists()][:6]
+                        self._save_recent_measurements()
+                except Exception as exc:
+                    self._log(f"Erreur chargement historique: {exc}")
             return
 
         try:
             with open(self.recent_history_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, list):
-                cleaned = []
-                for item in data:
-                    if not isinstance(item, dict):
-                        continue
-                    path = item.get("path", "")
-                    if path and Path(path).exists():
-                        cleaned.append(item)
-                self.recent_measurements = cleaned[:6]
+                lines = f.readlines()
+            self._recent_history_lines = len(lines)
+            seen = set()
+            cleaned = []
+            for line in reversed(lines):
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(item, dict):
+                    continue
+                path = item.get("path", "")
+                if path in seen:
+                    continue
+                seen.add(path)
+                if path and Path(path).exists():
+                    cleaned.append(item)
+                    if len(cleaned) == 6:
+                        break
+            self.recent_measurements = cleaned
         except Exception as exc:
-            self.console_output.append(f"Erreur chargement historique: {exc}")
+            self._log(f"Erreur chargement historique: {exc}")
 
     def _save_recent_measurements(self):
+        """Rewrite the history log with only the current entries (compaction)."""
+        tmp = self.recent_history_file.with_suffix(".tmp")
+        try:
+            self.base_save_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                for item in reversed(self.recent_measurements[:6]):
+                    f.write(json.dumps(item, ensure_ascii=False) + "\n")
+            os.replace(tmp, self.recent_history_file)
+            self._recent_history_lines = len(self.recent_measurements[:6])
+        except Exception as exc:
+            self._log(f"Erreur sauvegarde historique: {exc}")
+
+    def _append_recent(self, entry):
+        """Append one entry to the history log; compact it once it grows past 1000 lines."""
+        if self._recent_history_lines >= 1000:
+            self._save_recent_measurements()
+            return
         try:
             self.base_save_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.recent_history_file, "w", encoding="utf-8") as f:
-                json.dump(self.recent_measurements[:6], f, indent=2, ensure_ascii=False)
+            with open(self.recent_history_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._recent_history_lines += 1
         except Exception as exc:
-            self.console_output.append(f"Erreur sauvegarde historique: {exc}")
+            self._log(f"Erreur sauvegarde historique: {exc}")
 
     def _add_recent_measurement(self, path: Path, xyz=None):
         p = str(path)
@@ -682,11 +1262,9 @@ class SpectrumPlotter(QMainWindow):
 
         x = y = None
         if xyz is not None:
-            X, Y, Z = xyz
-            total = X + Y + Z
-            if total > 0:
-                x = float(X / total)
-                y = float(Y / total)
+            x, y = _xyz_to_xy(*xyz)
+            if x is not None:
+                x, y = float(x), float(y)
 
         entry = {
             "name": path.stem,
@@ -694,12 +1272,36 @@ class SpectrumPlotter(QMainWindow):
             "timestamp": datetime.now().strftime("%d/%m %H:%M"),
             "x": x,
             "y": y,
+            # Computed once here; the carousel only reads it back
+            "patch_hex": xy_to_patch_hex(x, y),
         }
+        npy_path = self._save_spectrum_sidecar(path)
+        if npy_path is not None:
+            entry["npy_path"] = str(npy_path)
         self.recent_measurements.insert(0, entry)
         self.recent_measurements = self.recent_measurements[:6]
-        self._save_recent_measurements()
+        self._append_recent(entry)
         self._refresh_recent_carousel()
 
+    def _save_spectrum_sidecar(self, path: Path):
+        """Store the last parsed spectrum as float32 next to a saved measurement.
+
+        Only files inside the save folder get a sidecar; files opened from
+        elsewhere are left untouched. Returns the .npy path or None.
+        """
+        if self._last_spectrum is None:
+            return None
+        try:
+            path.resolve().relative_to(self.base_save_dir.resolve())
+        except ValueError:
+            return None
+        npy_path = path.with_suffix(".npy")
+        try:
+            np.save(npy_path, np.vstack(self._last_spectrum).astype(np.float32))
+        except OSError:
+            return None
+        return npy_path
+
     def _reload_measurement_from_history(self, path_str: str):
         path = Path(path_str)
         if not path.exists():
@@ -709,80 +1311,130 @@ class SpectrumPlotter(QMainWindow):
             self._refresh_recent_carousel()
             return
 
+        # Sidecar still matches the .sp file: skip parsing it again
+        item = next((it for it in self.recent_measurements if it.get("path") == path_str), {})
+        npy_path = Path(item["npy_path"]) if item.get("npy_path") else None
+        if npy_path is not None and npy_path.exists() and npy_path.stat().st_mtime >= path.stat().st_mtime:
+            try:
+                spectrum = np.load(npy_path, mmap_mode="r")
+                self._last_spectrum = (spectrum[0], spectrum[1])
+                self._show_spectrum(spectrum[0], spectrum[1], str(path))
+                self._log(f"Mesure rechargée: {path}")
+                return
+            except (OSError, ValueError, IndexError):
+                pass
+
         self.plot_spectrum(str(path))
-        self.console_output.append(f"Mesure rechargée: {path}")
+        self._log(f"Mesure rechargée: {path}")
 
-    def _refresh_recent_carousel(self):
-        while self.recent_row.count():
-            item = self.recent_row.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-
-        if not self.recent_measurements:
-            empty_label = QLabel("Aucune mesure mémorisée pour le moment.")
-            empty_label.setStyleSheet("color: #829ab1; padding: 8px;")
-            self.recent_row.addWidget(empty_label)
-            self.recent_row.addStretch(1)
-            return
+    def _build_recent_cards(self):
+        """Create the empty-state label and the six measurement cards once.
+
+        _refresh_recent_carousel only updates their texts and visibility.
+        """
+        self._recent_empty_label = QLabel("Aucune mesure mémorisée pour le moment.")
+        self._recent_empty_label.setObjectName("recentEmpty")
+        self.recent_row.addWidget(self._recent_empty_label)
 
-        for item in self.recent_measurements[:6]:
+        self._recent_cards = []
+        for _ in range(6):
             card = QFrame()
             card.setFrameShape(QFrame.Shape.StyledPanel)
-            card.setStyleSheet("QFrame { background: #f7f9fc; border: 1px solid #d8e1ec; border-radius: 8px; }")
+            card.setObjectName("recentCard")
             card.setFixedWidth(180)
 
             card_layout = QVBoxLayout(card)
             card_layout.setContentsMargins(8, 8, 8, 8)
             card_layout.setSpacing(6)
 
-            patch = QLabel()
-            patch.setFixedHeight(20)
-            patch_color = "#cbd2d9"
-            if item.get("x") is not None and item.get("y") is not None:
-                try:
-                    x = float(item["x"])
-                    y = float(item["y"])
-                    if y > 0:
-                        X = x / y
-                        Y = 1.0
-                        Z = (1.0 - x - y) / y
-                        rr, gg, bb = xyz_to_rgb(X * 100.0, Y * 100.0, Z * 100.0)
-                        patch_color = f"rgb({rr}, {gg}, {bb})"
-                except Exception:
-                    patch_color = "#cbd2d9"
-            patch.setStyleSheet(f"background: {patch_color}; border-radius: 4px;")
-            card_layout.addWidget(patch)
-
-            name_label = QLabel(item.get("name", "mesure"))
-            name_label.setStyleSheet("font-weight: 600; color: #243b53;")
-            card_layout.addWidget(name_label)
-
-            meta_label = QLabel(item.get("timestamp", ""))
-            meta_label.setStyleSheet("color: #627d98; font-size: 11px;")
-            card_layout.addWidget(meta_label)
-
-            xy_txt = "xy: -"
-            if item.get("x") is not None and item.get("y") is not None:
-                xy_txt = f"xy: {item['x']:.3f}, {item['y']:.3f}"
-            xy_label = QLabel(xy_txt)
-            xy_label.setStyleSheet("color: #486581; font-size: 11px;")
-            card_layout.addWidget(xy_label)
+            card.patch = QLabel()
+            card.patch.setObjectName("cardPatch")
+            card.patch.setFixedHeight(20)
+            card.patch_color = None
+            card_layout.addWidget(card.patch)
+
+            card.name_label = QLabel()
+            card.name_label.setObjectName("cardName")
+            card_layout.addWidget(card.name_label)
+
+            card.meta_label = QLabel()
+            card.meta_label.setObjectName("cardMeta")
+            card_layout.addWidget(card.meta_label)
 
+            card.xy_label = QLabel()
+            card.xy_label.setObjectName("cardXy")
+            card_layout.addWidget(card.xy_label)
+
+            card.path = ""
+            card.item = None  # history entry currently shown by this card
             reload_btn = QPushButton("Recharger")
             reload_btn.setObjectName("secondaryButton")
-            reload_btn.clicked.connect(lambda _, p=item.get("path", ""): self._reload_measurement_from_history(p))
+            reload_btn.clicked.connect(lambda _, c=card: self._reload_measurement_from_history(c.path))
             card_layout.addWidget(reload_btn)
 
+            card.hide()
             self.recent_row.addWidget(card)
+            self._recent_cards.append(card)
 
         self.recent_row.addStretch(1)
 
+    @staticmethod
+    def _set_label_text(label, text):
+        if label.text() != text:
+            label.setText(text)
+
+    def _refresh_recent_carousel(self):
+        items = self.recent_measurements[:6]
+        self._recent_empty_label.setVisible(not items)
+
+        # Cards still showing the same entry are skipped; the others are
+        # updated in place and the strip is repainted once at the end.
+        self.recent_container.setUpdatesEnabled(False)
+        try:
+            for i, card in enumerate(self._recent_cards):
+                self._update_recent_card(card, items[i] if i < len(items) else None)
+        finally:
+            self.recent_container.setUpdatesEnabled(True)
+
+    def _update_recent_card(self, card, item):
+        if item is None:
+            card.item = None
+            card.hide()
+            return
+        if card.item is item:
+            return
+
+        if "patch_hex" not in item:
+            # Entry from an older history file: compute the colour once
+            try:
+                x, y = item.get("x"), item.get("y")
+                item["patch_hex"] = xy_to_patch_hex(
+                    None if x is None else float(x), None if y is None else float(y))
+            except (TypeError, ValueError, ZeroDivisionError):
+                item["patch_hex"] = None
+        patch_color = item["patch_hex"] or "#cbd2d9"
+        if patch_color != card.patch_color:
+            # Only the colour is per card; the shape comes from QLabel#cardPatch
+            card.patch.setStyleSheet(f"background: {patch_color};")
+            card.patch_color = patch_color
+
+        self._set_label_text(card.name_label, item.get("name", "mesure"))
+        self._set_label_text(card.meta_label, item.get("timestamp", ""))
+
+        xy_txt = "xy: -"
+        if item.get("x") is not None and item.get("y") is not None:
+            xy_txt = f"xy: {item['x']:.3f}, {item['y']:.3f}"
+        self._set_label_text(card.xy_label, xy_txt)
+
+        card.path = item.get("path", "")
+        card.item = item
+        card.show()
+
     def start_session(self):
         if self._oneshot_busy:
-            self.console_output.append("Une opération one-shot est déjà en cours. Patientez.")
+            self._log("Une opération one-shot est déjà en cours. Patientez.")
             return
-        self.console_output.append("Mode interactif masqué: utilisez ⚙ Calibrer puis ◉ Mesurer (one-shot).")
+        self._log("Mode interactif masqué: utilisez ⚙ Calibrer puis ◉ Mesurer (one-shot).")
         return
 
         if self.subprocess and self.subprocess.poll() is None:
@@ -790,14 +1442,13 @@ class SpectrumPlotter(QMainWindow):
 
         args = self._build_spotread_args(interactive=True)
 
-        self.console_output.append(f"Starting: {' '.join(args)}")
+        self._log(f"Starting: {' '.join(args)}")
 
         # Reset session state
-        self._stdout_buf = ""
+        self._stdout_reset()
         self._pending_result = False
-        self._calibrated = False
-        self.calib_status_label.setText("\U0001f534  Non calibr\u00e9")
-        self.calib_status_label.setStyleSheet("color: #c0392b; font-weight: bold; padding: 4px;")
+        self._last_xyz = None
+        self._set_calib_state(False)
 
         # Use PTY to simulate a terminal
         self.master_fd, slave_fd = pty.openpty()
@@ -812,16 +1463,16 @@ class SpectrumPlotter(QMainWindow):
                 close_fds=True
             )
         except Exception as e:
-            self.console_output.append(f"Failed to start: {e}")
+            self._log(f"Failed to start: {e}")
             os.close(self.master_fd)
             os.close(slave_fd)
             return
 
         os.close(slave_fd)  # Close slave in parent
 
-        # Setup QSocketNotifier to read output asynchronously
-        self.notifier = QSocketNotifier(self.master_fd, QSocketNotifier.Type.Read, self)
-        self.notifier.activated.connect(self.handle_output)
+        # Non-blocking reads: _drain_pty stops on EAGAIN
+        os.set_blocking(self.master_fd, False)
+        self._pty_timer.start()
 
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
@@ -846,23 +1497,22 @@ class SpectrumPlotter(QMainWindow):
         self.process_finished()
 
     def _spotread_env(self):
-        env = os.environ.copy()
-        extra = ["/usr/local/bin", "/opt/homebrew/bin", "/usr/bin",
-                 os.path.expanduser("~/bin")]
-        env["PATH"] = ":".join(extra) + ":" + env.get("PATH", "")
-        return env
+        return self._argyll_env
+
+    def _rescan_argyll_env(self):
+        """Resolve the spotread path on the ArgyllCMS PATH (startup and instrument refresh)."""
+        self._spotread_cmd = resolve_spotread_command(self._argyll_env)
 
     def _build_spotread_args(self, interactive: bool, calibration_only: bool = False):
-        args = ["spotread", "-v"]
+        args = [self._spotread_cmd, "-v"]
 
         instr_idx = self.instrument_combo.currentIndex()
         instr_data = self.instrument_combo.itemData(instr_idx)
         if instr_data is not None:
             args.extend(["-c", str(instr_data)])
 
-        mode_arg = self.mode_combo.currentData()
-        if mode_arg:
-            args.append(mode_arg)
+        if self._current_mode_arg:
+            args.append(self._current_mode_arg)
 
         if interactive:
             args.extend(["-s", self.temp_file])
@@ -876,59 +1526,69 @@ class SpectrumPlotter(QMainWindow):
                 if self.skip_calibration_checkbox.isChecked():
                     args.append("-N")
 
-        return args
+        # Fixed argv: handed to the worker thread as is, never mutated after this
+        return tuple(args)
 
     def _set_oneshot_busy(self, busy: bool, action_label: str = ""):
         self._oneshot_busy = busy
         if busy and action_label:
-            self.console_output.append(f"{action_label} en cours…")
+            self._log(f"{action_label} en cours…")
         self._update_execution_mode_ui()
 
     def _set_calibrated_ui(self):
-        self._calibrated = True
-        self.calib_status_label.setText("✅  Calibré")
-        self.calib_status_label.setStyleSheet("color: #27ae60; font-weight: bold; padding: 4px;")
+        self._set_calib_state(True)
+
+    def _set_calib_state(self, calibrated: bool):
+        """Update the calibration flag and indicator (styled via its `state` property)."""
+        self._calibrated = calibrated
+        label = self.calib_status_label
+        label.setText("✅  Calibré" if calibrated else "🔴  Non calibré")
+        label.setProperty("state", "ok" if calibrated else "")
+        label.style().unpolish(label)
+        label.style().polish(label)
 
     def _run_spotread_oneshot(self, calibration_only: bool = False):
         args = self._build_spotread_args(interactive=False, calibration_only=calibration_only)
-        self.console_output.append(f"Starting (one-shot): {' '.join(args)}")
+        self._log(f"Starting (one-shot): {' '.join(args)}")
 
         self._set_oneshot_busy(True, "Calibration" if calibration_only else "Mesure")
-        self._oneshot_thread = SpotreadOneShotThread(
+        self._oneshot_task = SpotreadOneShotTask(
             args=args,
             env=self._spotread_env(),
             timeout_s=120,
             calibration_only=calibration_only,
         )
-        self._oneshot_thread.output_ready.connect(self._on_oneshot_output_ready)
-        self._oneshot_thread.finished.connect(self._on_oneshot_finished)
-        self._oneshot_thread.finished.connect(self._oneshot_thread.deleteLater)
-        self._oneshot_thread.start()
+        signals = self._oneshot_task.signals
+        signals.progress.connect(self._on_oneshot_progress)
+        signals.output_ready.connect(self._on_oneshot_output_ready)
+        signals.finished.connect(self._on_oneshot_finished)
+        self._worker_pool.start(self._oneshot_task)
 
     def _on_oneshot_finished(self):
-        self._oneshot_thread = None
+        self._oneshot_task = None
         self._set_oneshot_busy(False)
 
+    def _on_oneshot_progress(self, line: str):
+        self._log(line.rstrip("\r\n"))
+
     def _on_oneshot_output_ready(self, raw: str, calibration_only: bool):
-        self.console_output.append(raw)
-        self._stdout_buf = raw
+        # The output itself was already shown line by line by _on_oneshot_progress
+        self._stdout_reset(raw)
 
-        raw_lower = raw.lower()
-        if re.search(r"calibration\s+(successful|complete|ok)|calibrated\s+ok", raw_lower):
+        flags = _spotread_issue_flags(raw)
+        if "ok" in flags:
             self._set_calibrated_ui()
-            self.console_output.append(">> Sonde calibrée ✅")
+            self._log(">> Sonde calibrée ✅")
 
-        if "wrong position" in raw_lower or "sensor should be" in raw_lower:
-            self.console_output.append(
+        if "dir" in flags:
+            self._log(
                 "⚠ Position capteur incorrecte: en mode écran/projo, mettez le capteur sur la surface à mesurer avant \"Mesurer\".")
 
         if calibration_only:
             return
 
-        match_xyz = re.search(
-            r"Result is XYZ:\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)", raw)
-        match_yxy = re.search(
-            r"Result is Yxy:\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)", raw)
+        match_xyz = _RE_RESULT_XYZ.search(raw)
+        match_yxy = _RE_RESULT_YXY.search(raw)
 
         if match_xyz:
             X, Y, Z = map(float, match_xyz.groups())
@@ -944,37 +1604,41 @@ class SpectrumPlotter(QMainWindow):
             if saved_path:
                 self._add_recent_measurement(saved_path, xyz=(X, Y, Z))
         else:
-            spec_written = self._write_spectrum_from_buffer()
-            if spec_written:
-                self.plot_spectrum(self.temp_file)
+            spectrum = self._write_spectrum_from_buffer()
+            if spectrum is not None:
+                self._plot_parsed_spectrum(spectrum, self.temp_file)
                 saved_path = self.save_measurement_file()
                 if saved_path:
                     self._add_recent_measurement(saved_path, xyz=(X, Y, Z))
 
+    def _cache_current_mode(self):
+        self._current_mode_arg = self.mode_combo.currentData() or ""
+        text = self.mode_combo.currentText()
+        self._current_mode_label = text.split("[")[0].strip() if text else "-"
+
+    def _on_mode_changed(self):
+        self._cache_current_mode()
+        self._update_mode_guidance()
+        self._update_status_banner()
+
     def _update_mode_guidance(self):
-        mode_arg = self.mode_combo.currentData()
-        if mode_arg == "-e":
-            txt = "Emission (-e): mesure écran/lumière directe. Capteur en position surface contre l'écran."
-        elif mode_arg == "-a":
-            txt = "Ambient (-a): mesure lumière ambiante. Utilisez l'accessoire/diffuseur ambiant de la sonde si nécessaire."
-        elif mode_arg == "-p":
-            txt = "Projector (-p): mode téléphoto si supporté (ColorMunki/i1Pro). Sinon préférez Emission (-e)."
-        else:
-            txt = "Spot (réflectance): mesure de surface réfléchissante."
-        self.mode_help_label.setText(txt)
+        self.mode_help_label.setText(
+            _MODE_GUIDANCE.get(self._current_mode_arg, _MODE_GUIDANCE[""]))
 
     def _update_execution_mode_ui(self):
         subprocess_obj = getattr(self, "subprocess", None)
         session_running = subprocess_obj is not None and subprocess_obj.poll() is None
         busy = getattr(self, "_oneshot_busy", False)
+        waiting = getattr(self, "_deferred_oneshot", None) is not None
+        scanning = getattr(self, "_instr_task", None) is not None
 
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(False)
-        self.calibrate_btn.setEnabled(not busy and not session_running)
-        self.measure_btn.setEnabled(not busy and not session_running)
+        self.calibrate_btn.setEnabled(not busy and not waiting and not session_running)
+        self.measure_btn.setEnabled(not busy and not waiting and not session_running)
 
-        self.refresh_instr_btn.setEnabled(not session_running and not busy)
-        self.instrument_combo.setEnabled(not session_running and not busy)
+        self.refresh_instr_btn.setEnabled(not session_running and not busy and not scanning)
+        self.instrument_combo.setEnabled(not session_running and not busy and not scanning)
         self.mode_combo.setEnabled(not session_running and not busy)
         self.exec_mode_combo.setEnabled(False)
         self.change_folder_btn.setEnabled(not busy)
@@ -986,12 +1650,14 @@ class SpectrumPlotter(QMainWindow):
 
     def _update_status_banner(self):
         instr = self.instrument_combo.currentText() or "-"
-        mode = self.mode_combo.currentText().split("[")[0].strip() if self.mode_combo.count() else "-"
+        mode = self._current_mode_label
         process_obj = getattr(self, "subprocess", None)
         interactive_running = process_obj is not None and process_obj.poll() is None
 
         if self._oneshot_busy:
             run_state = "Exécution one-shot…"
+        elif self._deferred_oneshot is not None:
+            run_state = "En attente du scan…"
         elif interactive_running:
             run_state = "Session interactive active"
         else:
@@ -1005,70 +1671,163 @@ class SpectrumPlotter(QMainWindow):
     def trigger_calibration(self):
         """Send space to spotread to trigger calibration."""
         if self._oneshot_busy:
-            self.console_output.append("Une opération one-shot est déjà en cours.")
+            self._log("Une opération one-shot est déjà en cours.")
             return
-        self._run_spotread_oneshot(calibration_only=True)
+        self._start_oneshot_when_idle(calibration_only=True)
 
     def trigger_measurement(self):
         """Send space to spotread to take a measurement."""
         if self._oneshot_busy:
-            self.console_output.append("Une opération one-shot est déjà en cours.")
+            self._log("Une opération one-shot est déjà en cours.")
             return
-        self._run_spotread_oneshot(calibration_only=False)
+        self._start_oneshot_when_idle(calibration_only=False)
+
+    def _start_oneshot_when_idle(self, calibration_only: bool):
+        """Run now, or as soon as the instrument scan in flight has finished
+        (both talk to the same USB device). on_instruments_found resumes it."""
+        if self._instr_task is not None:
+            # Remember the instrument: the scan result may change the selection
+            self._deferred_oneshot = (calibration_only, self.instrument_combo.currentData())
+            action = "Calibration" if calibration_only else "Mesure"
+            self._log(f"{action} en attente du scan d'instruments: elle démarrera juste après.")
+            self._update_execution_mode_ui()
+            return
+        self._run_spotread_oneshot(calibration_only=calibration_only)
 
     # ------------------------------------------------------------------
     # PTY output handler
     # ------------------------------------------------------------------
-    def handle_output(self):
+    def _drain_pty(self):
+        """Read everything the child has written since the last tick and
+        process it as one chunk."""
         if self.master_fd is None:
             return
-        try:
-            data_bytes = os.read(self.master_fd, 4096)
+        parts = []
+        finished = False
+        while True:
+            try:
+                data_bytes = os.read(self.master_fd, 65536)
+            except BlockingIOError:
+                break
+            except OSError:
+                # EIO once the child has exited and closed its side
+                finished = True
+                break
             if not data_bytes:
-                self.process_finished()
-                return
-
-            data = data_bytes.decode('utf-8', errors='replace')
-            self.console_output.insertPlainText(data)
-            self.console_output.ensureCursorVisible()
-
-            # Accumulate buffer for multi-line spectral parsing
-            self._stdout_buf += data
-            # Trim to last 32 KB to avoid unbounded growth
-            if len(self._stdout_buf) > 32768:
-                self._stdout_buf = self._stdout_buf[-32768:]
-
-            # --- Calibration state detection ---
-            buf_lower = self._stdout_buf.lower()
-            if (not self._calibrated and
-                    re.search(r"calibration\s+(successful|complete|ok)|calibrated\s+ok",
-                               buf_lower)):
-                self._calibrated = True
-                self.calib_status_label.setText("\U00002705  Calibr\u00e9")
-                self.calib_status_label.setStyleSheet(
-                    "color: #27ae60; font-weight: bold; padding: 4px;")
-                self.console_output.append(">> Sonde calibr\u00e9e \u2705")
-
-            # --- Detect result in this chunk ---
-            match_xyz = re.search(
-                r"Result is XYZ:\s+([\d\.]+)\s+([\d\.]+)\s+([\d\.]+)", data)
-            match_yxy = re.search(
-                r"Result is Yxy:\s+([\d\.]+)\s+([\d\.]+)\s+([\d\.]+)", data)
+                finished = True
+                break
+            parts.append(data_bytes)
+        if parts:
+            self.handle_output(b"".join(parts).decode('utf-8', errors='replace'))
+        if finished:
+            self.process_finished()
 
+    def handle_output(self, data):
+        """Feed one decoded PTY chunk to the console and the result detection."""
+        self._console_pending.append(data)
+        if not self._console_flush_timer.isActive():
+            self._console_flush_timer.start()
+
+        # Accumulate buffer for multi-line spectral parsing
+        self._stdout_append(data)
+
+        # Only the text not searched yet is scanned (it starts a little before
+        # this chunk so a line split across two reads is still seen whole).
+        # Offsets below are relative to new_text, which starts at scan_start.
+        scan_start = self._stdout_scan_pos
+        new_text = self._stdout_tail(scan_start)
+
+        # --- Calibration state detection ---
+        if not self._calibrated and "ok" in _spotread_issue_flags(new_text):
+            self._set_calib_state(True)
+            self._log(">> Sonde calibr\u00e9e \u2705")
+
+        # --- Detect results in the new text (a drained batch may hold several) ---
+        scan_pos = 0
+        found = False
+        while True:
+            match_xyz = _RE_RESULT_XYZ.search(new_text, scan_pos)
+            match_yxy = None if match_xyz else _RE_RESULT_YXY.search(new_text, scan_pos)
             if match_xyz:
-                X, Y, Z = map(float, match_xyz.groups())
-                self._last_xyz = (X, Y, Z)
-                self._pending_result = True
-                # Give PTY 300 ms to flush the spectral block before parsing
-                QTimer.singleShot(300, self._process_pending_result)
+                self._last_xyz = tuple(map(float, match_xyz.groups()))
             elif match_yxy:
                 Yv, x, y = map(float, match_yxy.groups())
                 self._last_xyz = yxy_to_xyz(Yv, x, y)
-                self._pending_result = True
-                QTimer.singleShot(300, self._process_pending_result)
+            else:
+                break
+            scan_pos = (match_xyz or match_yxy).end()
+            found = True
+        if found:
+            self._stdout_scan_pos = scan_start + scan_pos
+            self._pending_result = True
+            # Give PTY 300 ms to flush the spectral block before parsing
+            QTimer.singleShot(300, self._process_pending_result)
+        else:
+            self._stdout_scan_pos = max(scan_start, self._stdout_len - _SCAN_OVERLAP)
 
-        except OSError:
-            self.process_finished()
+    # ------------------------------------------------------------------
+    # spotread output buffer
+    # ------------------------------------------------------------------
+    def _stdout_reset(self, text=""):
+        self._stdout_chunks = deque([text] if text else ())
+        self._stdout_len = len(text)
+        self._stdout_joined = text  # whole buffer as one string, None when stale
+        # Offsets into the buffer: where the next result / spectrum search starts
+        self._stdout_scan_pos = 0
+        self._spectrum_scan_pos = 0
+
+    def _stdout_append(self, data):
+        """Append a chunk; whole chunks are dropped from the left while at
+        least _STDOUT_KEEP characters remain, so nothing is copied."""
+        chunks = self._stdout_chunks
+        chunks.append(data)
+        self._stdout_len += len(data)
+        self._stdout_joined = None
+        while len(chunks) > 1 and self._stdout_len - len(chunks[0]) >= _STDOUT_KEEP:
+            dropped = len(chunks.popleft())
+            self._stdout_len -= dropped
+            self._stdout_scan_pos = max(0, self._stdout_scan_pos - dropped)
+            self._spectrum_scan_pos = max(0, self._spectrum_scan_pos - dropped)
+
+    def _stdout_text(self):
+        """The whole buffer, joined at most once per change."""
+        if self._stdout_joined is None:
+            self._stdout_joined = "".join(self._stdout_chunks)
+        return self._stdout_joined
+
+    def _stdout_tail(self, pos):
+        """Buffer text from offset pos on, joining only the chunks it spans."""
+        if self._stdout_joined is not None:
+            return self._stdout_joined[pos:]
+        need = self._stdout_len - pos
+        parts = []
+        got = 0
+        for chunk in reversed(self._stdout_chunks):
+            parts.append(chunk)
+            got += len(chunk)
+            if got >= need:
+                break
+        parts.reverse()
+        return "".join(parts)[got - need:]
+
+    def _log(self, text):
+        """Queue a console line; it is written with the next batched flush."""
+        self._console_pending.append("\n" + text)
+        if not self._console_flush_timer.isActive():
+            self._console_flush_timer.start()
+
+    def _flush_console(self):
+        """Write buffered console output (PTY chunks and _log lines) in a single insert."""
+        self._console_flush_timer.stop()
+        if not self._console_pending:
+            return
+        text = "".join(self._console_pending)
+        if self.console_output.document().isEmpty() and text.startswith("\n"):
+            text = text[1:]
+        self.console_output.moveCursor(QTextCursor.MoveOperation.End)
+        self.console_output.insertPlainText(text)
+        self.console_output.ensureCursorVisible()
+        self._console_pending.clear()
 
     def _process_pending_result(self):
         """Called 300 ms after a 'Result is' line to give the spectrum time to arrive."""
@@ -1076,56 +1835,54 @@ class SpectrumPlotter(QMainWindow):
             return
         self._pending_result = False
 
+        if self._last_xyz is None:
+            return
+        # Only the most recent reading of a drained batch is kept
         X, Y, Z = self._last_xyz
+        self._last_xyz = None
         self.update_color_display(X, Y, Z)
 
-        spec_written = self._write_spectrum_from_buffer()
-        if spec_written:
-            self.plot_spectrum(self.temp_file)
+        spectrum = self._write_spectrum_from_buffer()
+        if spectrum is not None:
+            self._plot_parsed_spectrum(spectrum, self.temp_file)
             saved_path = self.save_measurement_file()
             if saved_path:
                 self._add_recent_measurement(saved_path, xyz=(X, Y, Z))
         else:
-            self.console_output.append(
+            self._log(
                 "(Pas de donn\u00e9es spectrales dans la sortie — v\u00e9rifiez que l'instrument supporte le mode spectral)")
 
     def _write_spectrum_from_buffer(self):
         """
-        Parse a spectral block from the accumulated stdout buffer and write
-        a minimal CGATS .sp file so plot_spectrum() can display it.
+        Parse a spectral block from the accumulated stdout buffer, write it
+        to temp_file as a minimal CGATS .sp (the file that gets saved) and
+        return (wavelengths, values) so it can be plotted without reading the
+        file back. Returns None when no complete block is available.
 
         spotread prints (when the device supports it):
           Radiometric spectrum, 380 nm to 730 nm at 10 nm increments, 36 values:
              0.083   0.099  ...
         """
-        m = re.search(
-            r"[Rr]adiometric\s+spectrum[^,]*,\s*(\d+)\s*nm\s+to\s+(\d+)\s*nm"
-            r"\s+at\s+(\d+)\s*nm\s+increments[^:]*:\s*\n([\d\.\s]+)",
-            self._stdout_buf
-        )
+        # Start after the last block written so an older spectrum still in
+        # the buffer is not picked up again
+        m = _RE_SPECTRUM.search(self._stdout_text(), self._spectrum_scan_pos)
         if not m:
-            return False
+            return None
 
         start_nm = int(m.group(1))
         end_nm   = int(m.group(2))
         step_nm  = int(m.group(3))
-        raw_vals = m.group(4).split()
 
-        wavelengths = list(range(start_nm, end_nm + step_nm, step_nm))
-        values = []
-        for v in raw_vals:
-            try:
-                values.append(float(v))
-            except ValueError:
-                pass
-            if len(values) == len(wavelengths):
-                break
+        header, wavelengths = _cgats_header(start_nm, end_nm, step_nm)
+        # The block holds only digits, dots and whitespace: one C-level parse
+        values = np.fromstring(m.group(4), dtype=np.float64, sep=" ")
 
-        if not values or len(values) != len(wavelengths):
-            return False
+        if not len(wavelengths) or len(values) < len(wavelengths):
+            return None
+        values = values[:len(wavelengths)]
+        self._spectrum_scan_pos = m.end()
 
-        header   = " ".join(f"NM_{wl}" for wl in wavelengths)
-        data_row = " ".join(f"{v:.6f}" for v in values)
+        data_row = " ".join(f"{v:.6f}" for v in values.tolist())
         cgats = (
             f"CGATS.17\n"
             f"ORIGINATOR \"spotread\"\n"
@@ -1137,15 +1894,13 @@ class SpectrumPlotter(QMainWindow):
         try:
             with open(self.temp_file, 'w') as f:
                 f.write(cgats)
-            return True
         except Exception as e:
-            self.console_output.append(f"Erreur \u00e9criture spectre: {e}")
-            return False
+            self._log(f"Erreur \u00e9criture spectre: {e}")
+            return None
+        return wavelengths, values
 
     def process_finished(self):
-        if self.notifier:
-            self.notifier.setEnabled(False)
-            self.notifier = None
+        self._pty_timer.stop()
 
         if self.master_fd is not None:
             try:
@@ -1156,8 +1911,9 @@ class SpectrumPlotter(QMainWindow):
 
         self.subprocess = None
         self._pending_result = False
+        self._last_xyz = None
 
-        self.console_output.append("Process Finished.")
+        self._log("Process Finished.")
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(False)
         self.measure_btn.setEnabled(True)
@@ -1167,41 +1923,82 @@ class SpectrumPlotter(QMainWindow):
         self.mode_combo.setEnabled(True)
         self.exec_mode_combo.setEnabled(False)
         # Reset calibration indicator
-        self._calibrated = False
-        self.calib_status_label.setText("\U0001f534  Non calibr\u00e9")
-        self.calib_status_label.setStyleSheet("color: #c0392b; font-weight: bold; padding: 4px;")
+        self._set_calib_state(False)
         self._update_execution_mode_ui()
 
     # ------------------------------------------------------------------
     # Instrument enumeration
     # ------------------------------------------------------------------
-    def enumerate_instruments(self):
-        """Launch InstrumentEnumeratorThread to populate the instrument combo."""
-        # Stop any still-running enumeration before starting a new one
-        if self._instr_thread is not None and self._instr_thread.isRunning():
-            self._instr_thread.quit()
-            self._instr_thread.wait(500)
+    def _enumerate_instruments_debounced(self):
+        """Refresh button: schedule one rescan unless one is pending or running."""
+        if self._instr_debounce_timer.isActive() or self._instr_task is not None:
+            return
+        self.refresh_instr_btn.setEnabled(False)
+        self._instr_debounce_timer.start()
+
+    def enumerate_instruments(self, use_cache=False):
+        """Submit an InstrumentScanTask to populate the instrument combo.
+
+        The list depends on what is plugged in, so spotread always runs; at
+        startup (use_cache) the last scan's list is shown meanwhile.
+        """
+        # A running scan cannot be interrupted; its result will be used instead
+        if self._instr_task is not None:
+            return
         self.instrument_combo.setEnabled(False)
         self.refresh_instr_btn.setEnabled(False)
-        self.instrument_combo.clear()
-        self.instrument_combo.addItem("Recherche...", None)
-        self._instr_thread = InstrumentEnumeratorThread()  # no parent — lives in its own thread
-        self._instr_thread.debug_output.connect(
-            lambda txt: self.console_output.append("[spotread -?]\n" + txt[:500]))
-        self._instr_thread.instruments_found.connect(self.on_instruments_found)
-        self._instr_thread.start()
+        if not self._instruments_key:
+            # A listed instrument stays (selected) until the scan result
+            # replaces it; otherwise show the search in the combo.
+            self.instrument_combo.clear()
+            self.instrument_combo.addItem("Recherche...", None)
+            self._instruments_key = None
+        if not use_cache:
+            # Explicit refresh: spotread may have been installed or updated meanwhile
+            self._rescan_argyll_env()
+        self._instr_task = InstrumentScanTask(
+            self._argyll_env, self._spotread_cmd,
+            self.instrument_cache_file, use_cache)
+        self._instr_task.signals.debug_output.connect(
+            lambda txt: self._log("[spotread -?]\n" + txt[:500]))
+        self._instr_task.signals.cached_instruments.connect(self._fill_instrument_combo)
+        self._instr_task.signals.instruments_found.connect(self.on_instruments_found)
+        self._worker_pool.start(self._instr_task)
+
+    def _fill_instrument_combo(self, instruments: dict):
+        """Show instruments in the combo, unless it already lists exactly these.
+
+        Also used for the cached list at startup: the combo stays disabled
+        until the live scan result replaces (or confirms) it.
+        """
+        instruments_key = frozenset(instruments.items())
+        if instruments_key == self._instruments_key:
+            return
+        self._instruments_key = instruments_key
+        # Fill the combo silently and repaint it once at the end
+        combo = self.instrument_combo
+        combo.blockSignals(True)
+        combo.setUpdatesEnabled(False)
+        try:
+            combo.clear()
+            if instruments:
+                for idx, name in sorted(instruments.items()):
+                    combo.addItem(f"{idx}: {name}", idx)
+            else:
+                combo.addItem("(aucun instrument d\u00e9tect\u00e9)", None)
+        finally:
+            combo.setUpdatesEnabled(True)
+            combo.blockSignals(False)
 
     def on_instruments_found(self, instruments: dict):
         """Populate instrument combo from enumeration results."""
-        self.instrument_combo.clear()
+        self._instr_task = None
+        self._fill_instrument_combo(instruments)
         if instruments:
-            for idx, name in sorted(instruments.items()):
-                self.instrument_combo.addItem(f"{idx}: {name}", idx)
-            self.console_output.append(
+            self._log(
                 f"Instruments d\u00e9tect\u00e9s: {len(instruments)}")
         else:
-            self.instrument_combo.addItem("(aucun instrument d\u00e9tect\u00e9)", None)
-            self.console_output.append(
+            self._log(
                 "Aucun instrument d\u00e9tect\u00e9 — v\u00e9rifiez la connexion USB et qu'ArgyllCMS est install\u00e9.")
         # Only re-enable these controls when no measurement session is active
         session_idle = (self.subprocess is None or self.subprocess.poll() is not None) and not self._oneshot_busy
@@ -1209,38 +2006,55 @@ class SpectrumPlotter(QMainWindow):
         self.refresh_instr_btn.setEnabled(session_idle)
         self._update_status_banner()
 
+        if self._deferred_oneshot is not None and not self._oneshot_busy:
+            (calibration_only, instrument), self._deferred_oneshot = self._deferred_oneshot, None
+            # None: nothing was selected yet ("Recherche..."), the scan picks it
+            if instrument is None or self.instrument_combo.currentData() == instrument:
+                self._run_spotread_oneshot(calibration_only=calibration_only)
+            else:
+                self._log("L'instrument sélectionné a changé pendant le scan: opération annulée, relancez-la.")
+                self._update_execution_mode_ui()
+
     def select_save_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Choisir le dossier de sauvegarde")
         if folder:
             self.base_save_dir = Path(folder)
             self.base_save_dir.mkdir(parents=True, exist_ok=True)
-            self.recent_history_file = self.base_save_dir / "recent_measurements.json"
+            self.recent_history_file = self.base_save_dir / "recent_measurements.ndjson"
+            if self._colorimetry_save_timer.isActive():
+                self._save_colorimetry_cache()  # pending entries belong to the old folder
+            self.colorimetry_cache_file = self.base_save_dir / "colorimetry_cache.json"
+            self._colorimetry_cache = None
             self.save_folder_input.setText(str(self.base_save_dir))
-            self.console_output.append(f"Dossier de sauvegarde: {self.base_save_dir}")
+            self._log(f"Dossier de sauvegarde: {self.base_save_dir}")
             self._load_recent_measurements()
             self._refresh_recent_carousel()
 
     def sanitize_measurement_name(self, name):
-        cleaned = re.sub(r"[^\w\-]+", "_", name.strip())
+        cleaned = _SANITIZE_RE.sub("_", name.strip())
         return cleaned.strip("_") or "mesure"
 
     def resolve_unique_path(self, folder, base_name, suffix):
-        candidate = folder / f"{base_name}{suffix}"
-        if not candidate.exists():
-            return candidate
-        index = 1
+        """First free <base_name>[_n]<suffix> in folder, created empty to reserve it."""
+        # One directory listing rules out the taken names without a syscall each
+        with os.scandir(folder) as entries:
+            existing = {entry.name for entry in entries}
+        index = 0
         while True:
-            candidate = folder / f"{base_name}_{index}{suffix}"
-            if not candidate.exists():
-                return candidate
+            name = f"{base_name}_{index}{suffix}" if index else f"{base_name}{suffix}"
+            if name not in existing:
+                candidate = folder / name
+                try:
+                    # O_EXCL still claims the name atomically, should it appear meanwhile
+                    os.close(os.open(candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+                    return candidate
+                except FileExistsError:
+                    pass
             index += 1
 
     def save_measurement_file(self):
-        if not os.path.exists(self.temp_file):
-            return None
-
         try:
-            mtime = os.path.getmtime(self.temp_file)
+            mtime = os.stat(self.temp_file).st_mtime
         except OSError:
             return None
 
@@ -1250,18 +2064,32 @@ class SpectrumPlotter(QMainWindow):
         date_folder = self.base_save_dir / datetime.now().strftime("%Y-%m-%d")
         date_folder.mkdir(parents=True, exist_ok=True)
         base_name = self.sanitize_measurement_name(self.measurement_name_input.text())
-        destination = self.resolve_unique_path(date_folder, base_name, ".sp")
 
+        destination = None
         try:
-            shutil.move(self.temp_file, destination)
+            destination = self.resolve_unique_path(date_folder, base_name, ".sp")
+            try:
+                os.replace(self.temp_file, destination)
+            except OSError as exc:
+                if exc.errno != errno.EXDEV:
+                    raise
+                # Save folder on another filesystem: copy, then drop the temp file
+                shutil.move(self.temp_file, destination)
             self.last_saved_mtime = mtime
-            self.console_output.append(f"Mesure sauvegardée: {destination}")
+            self._log(f"Mesure sauvegardée: {destination}")
             return destination
         except Exception as exc:
-            self.console_output.append(f"Erreur sauvegarde mesure: {exc}")
+            if destination is not None:
+                # Drop the placeholder; the measurement is still in temp_file
+                try:
+                    destination.unlink()
+                except OSError:
+                    pass
+            self._log(f"Erreur sauvegarde mesure: {exc}")
             return None
 
     def update_color_display(self, X, Y, Z):
+        self._colorimetry_job += 1  # a pending spectrum result must not overwrite this reading
         r, g, b = xyz_to_rgb(X, Y, Z)
         self.color_patch.setStyleSheet(f"background-color: rgb({r}, {g}, {b}); border: 1px solid #9aa5b1; border-radius: 5px;")
         self.color_values_label.setText(f"XYZ: {X:.2f} {Y:.2f} {Z:.2f}\nRGB: {r} {g} {b}")
@@ -1282,113 +2110,104 @@ class SpectrumPlotter(QMainWindow):
             self._add_recent_measurement(Path(file_path))
 
     def plot_spectrum(self, file_path):
-        if not os.path.exists(file_path):
+        self._last_spectrum = None
+        try:
+            text = _read_text(file_path)
+        except OSError:
             return
-            
+        lines = text.splitlines()
+        if "BEGIN_DATA" not in text and "END_DATA" not in text:
+            # No CGATS blocks: an appended tabular export only needs its last
+            # header and the lines after it.
+            del lines[:_last_tabular_header_index(lines)]
+
         try:
-            with open(file_path, 'r') as file:
-                lines = file.readlines()
-            
-            # Robust CGATS Parser
+            # Robust single-pass parser. CGATS blocks, simple tabular exports
+            # (Reading X Y Z ... 380.000 ...) and bare "wl value" pairs are
+            # all collected in one pass over the lines.
             header_fields = []
             data_values = []
-            
-            in_format = False
-            in_data = False
-            
-            # Check for simple tabular format (Reading X Y Z ... 380.000 ...)
-            is_simple_tabular = False
-            header_index = -1
-            
-            # Find the header line (contains many wavelengths)
-            # We look for the LAST header in the file, in case multiple measurements are appended
-            for i, line in enumerate(lines):
-                parts = line.strip().split()
-                wl_count = 0
-                for part in parts:
-                    try:
-                        val = float(part)
-                        if 300 <= val <= 830:
-                            wl_count += 1
-                    except ValueError:
-                        pass
-                
-                if wl_count > 10:
-                    is_simple_tabular = True
-                    header_index = i
-                    header_fields = parts
-            
-            if is_simple_tabular:
-                # Find the last data line after the header
-                # We search backwards from the end of the file
-                # But we must ensure it's after the header_index
-                for line in reversed(lines[header_index+1:]):
-                    if line.strip():
-                        data_values = line.strip().split()
-                        break
-
-            if not is_simple_tabular:
-                # Standard CGATS parsing
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-                        
-                    if line == "BEGIN_DATA_FORMAT":
-                        in_format = True
+            tabular_header = None
+            tabular_data = None
+            pair_lines = []
+
+            state = _PARSE_IDLE
+            for line in lines:
+                parts = line.split()
+                if not parts:
+                    continue
+
+                if len(parts) == 1:
+                    token = parts[0]
+                    if token == "BEGIN_DATA_FORMAT":
+                        state = _PARSE_IN_FORMAT
                         continue
-                    if line == "END_DATA_FORMAT":
-                        in_format = False
+                    if token == "END_DATA_FORMAT":
+                        state = _PARSE_IDLE
                         continue
-                        
-                    if line == "BEGIN_DATA":
-                        in_data = True
-                        continue
-                    if line == "END_DATA":
-                        in_data = False
+                    if token == "END_DATA":
+                        # Only the first data block is used: stop reading.
+                        break
+                    if token == "BEGIN_DATA":
+                        state = _PARSE_IN_DATA
                         continue
-                        
-                    if in_format:
-                        header_fields.extend(line.split())
-                    
-                    if in_data:
-                        # Handle comments or empty lines if any
-                        if line.startswith('#'): continue
-                        data_values.extend(line.split())
+
+                if len(parts) == 2:
+                    pair_lines.append(parts)
+
+                if state == _PARSE_IN_FORMAT:
+                    header_fields.extend(parts)
+                elif state == _PARSE_IN_DATA:
+                    # Handle comments if any
+                    if not parts[0].startswith('#'):
+                        data_values.extend(parts)
+                else:
+                    # Outside CGATS blocks: look for a header line containing
+                    # many wavelengths. We keep the LAST header in the file, in
+                    # case multiple measurements are appended, and the last
+                    # non-empty line after it as its data.
+                    if _is_wavelength_header(parts, line):
+                        tabular_header = parts
+                        tabular_data = None
+                    elif tabular_header is not None:
+                        tabular_data = parts
+
+            is_simple_tabular = tabular_header is not None
+            if is_simple_tabular:
+                header_fields = tabular_header
+                data_values = tabular_data or []
 
             longueur_onde = []
             intensité = []
 
             # Strategy 0: Simple Tabular (Header has wavelengths)
             if is_simple_tabular:
-                self.console_output.append(f"Debug: Detected Simple Tabular format. Header cols: {len(header_fields)}, Data cols: {len(data_values)}")
+                self._log(f"Debug: Detected Simple Tabular format. Header cols: {len(header_fields)}, Data cols: {len(data_values)}")
                 
                 if not data_values:
-                    self.console_output.append("Error: Header found but no data line found.")
+                    self._log("Error: Header found but no data line found.")
                     return
 
-                for idx, field in enumerate(header_fields):
-                    try:
-                        wl = float(field)
-                        # Filter out non-wavelength numbers (like '1' if it was in header, though unlikely for 'Reading')
-                        # And ensure we have corresponding data
-                        if 300 <= wl <= 830 and idx < len(data_values):
-                            val = float(data_values[idx])
-                            longueur_onde.append(wl)
-                            intensité.append(val)
-                    except ValueError:
-                        pass
-                self.console_output.append(f"Debug: Extracted {len(longueur_onde)} spectral points.")
+                # Only columns that have corresponding data
+                n_cols = min(len(header_fields), len(data_values))
+                wl_row = np.fromiter((_safe_float(f) for f in header_fields[:n_cols]), dtype=np.float64, count=n_cols)
+                val_row = np.fromiter((_safe_float(v) for v in data_values[:n_cols]), dtype=np.float64, count=n_cols)
+                # Filter out non-wavelength numbers (like '1' if it was in header, though unlikely for 'Reading')
+                # and tokens that failed to parse (NaN)
+                keep = (wl_row >= 300) & (wl_row <= 830) & ~np.isnan(val_row)
+                longueur_onde = wl_row[keep]
+                intensité = val_row[keep]
+                self._log(f"Debug: Extracted {len(longueur_onde)} spectral points.")
                 
                 # If we found a tabular format, we trust it. If extraction failed, don't try other strategies.
-                if not longueur_onde:
-                     self.console_output.append("Error: Could not extract spectral data from tabular format.")
+                if len(longueur_onde) == 0:
+                     self._log("Error: Could not extract spectral data from tabular format.")
                      return
 
             # Strategy 1: Wide Format (SPEC_xxx or NM_xxx)
             # Check if headers contain spectral bands
             spec_indices = []
-            if not longueur_onde and not is_simple_tabular:
+            if not is_simple_tabular:
                 for idx, field in enumerate(header_fields):
                     if field.startswith("SPEC_") or field.startswith("NM_"):
                         try:
@@ -1405,16 +2224,17 @@ class SpectrumPlotter(QMainWindow):
                 if len(data_values) >= num_fields:
                     # Take the first row/set
                     first_set = data_values[:num_fields]
-                    
-                    for idx, wl in spec_indices:
-                        if idx < len(first_set):
-                            try:
-                                val = float(first_set[idx])
-                                longueur_onde.append(wl)
-                                intensité.append(val)
-                            except ValueError:
-                                pass
-            elif not longueur_onde and not is_simple_tabular:
+
+                    # Convert the row once, gather the spectral columns, and
+                    # drop the tokens that failed to parse (NaN).
+                    row = np.fromiter((_safe_float(v) for v in first_set), dtype=np.float64, count=num_fields)
+                    idx_arr = np.fromiter((idx for idx, _ in spec_indices), dtype=np.int64, count=len(spec_indices))
+                    wl_arr = np.fromiter((wl for _, wl in spec_indices), dtype=np.float64, count=len(spec_indices))
+                    vals = row[idx_arr]
+                    good = ~np.isnan(vals)
+                    longueur_onde = wl_arr[good]
+                    intensité = vals[good]
+            elif not is_simple_tabular:
                 # Strategy 2: Tall Format (Columns)
                 # Look for 'Wavelength' and 'Spectral'/'Value' columns
                 # Or just assume 2 columns if not specified
@@ -1442,154 +2262,247 @@ class SpectrumPlotter(QMainWindow):
                     # If num_cols is 0 (e.g. no format specified?), assume 2
                     if num_cols == 0: num_cols = 2
                     
-                    for i in range(0, len(data_values), num_cols):
-                        if i + max(wl_col, val_col) < len(data_values):
-                            try:
-                                wl = float(data_values[i + wl_col])
-                                val = float(data_values[i + val_col])
-                                longueur_onde.append(wl)
-                                intensité.append(val)
-                            except ValueError:
-                                pass
+                    # Lay the tokens out as a (rows, num_cols) table; a short
+                    # last row is padded with NaN, like unparsable tokens.
+                    n_rows = -(-len(data_values) // num_cols)
+                    table = np.full(n_rows * num_cols, np.nan)
+                    table[:len(data_values)] = np.fromiter(
+                        (_safe_float(v) for v in data_values), dtype=np.float64, count=len(data_values))
+                    pairs = table.reshape(n_rows, num_cols)[:, [wl_col, val_col]]
+                    pairs = pairs[~np.isnan(pairs).any(axis=1)]
+                    longueur_onde = pairs[:, 0]
+                    intensité = pairs[:, 1]
 
             # Fallback for legacy/simple files (just numbers)
-            if not longueur_onde and not header_fields:
-                 # Try parsing pairs from all lines
-                 for line in lines:
-                     parts = line.split()
-                     if len(parts) == 2:
-                         try:
-                             wl = float(parts[0])
-                             val = float(parts[1])
-                             longueur_onde.append(wl)
-                             intensité.append(val)
-                         except ValueError:
-                             pass
+            if len(longueur_onde) == 0 and not header_fields:
+                 # Try parsing the two-token lines seen during the scan
+                 pairs = np.fromiter((_safe_float(t) for parts in pair_lines for t in parts),
+                                     dtype=np.float64, count=2 * len(pair_lines)).reshape(-1, 2)
+                 pairs = pairs[~np.isnan(pairs).any(axis=1)]
+                 longueur_onde = pairs[:, 0]
+                 intensité = pairs[:, 1]
 
             longueur_onde = np.array(longueur_onde, dtype=float)
             intensité = np.array(intensité, dtype=float)
 
             if len(longueur_onde) == 0 or len(intensité) == 0:
-                self.console_output.append("Error: No spectral data found in file.")
+                self._log("Error: No spectral data found in file.")
                 return
 
-            # --- Colorimetry Calculations ---
-            try:
-                # Create Spectral Distribution
-                # Ensure wavelengths are sorted
-                sorted_indices = np.argsort(longueur_onde)
-                wl_sorted = longueur_onde[sorted_indices]
-                int_sorted = intensité[sorted_indices]
-                
-                data = dict(zip(wl_sorted, int_sorted))
-                sd = colour.SpectralDistribution(data, name='Sample')
+            self._last_spectrum = (longueur_onde, intensité)
+            self._show_spectrum(longueur_onde, intensité, file_path)
 
-                # Interpolate to standard 1nm interval for colour-science
-                # This fixes the "measurement interval" error for irregular data (e.g. 3.3nm from i1Pro)
-                sd.interpolate(colour.SpectralShape(sd.shape.start, sd.shape.end, 1))
+        except Exception as e:
+            self._log(f"Error plotting: {e}")
+            import traceback
+            traceback.print_exc()
+
+    def _plot_parsed_spectrum(self, spectrum, file_path):
+        """Like plot_spectrum(file_path), for a spectrum that is already in memory."""
+        self._last_spectrum = spectrum
+        self._show_spectrum(*spectrum, file_path)
+
+    def _show_spectrum(self, longueur_onde, intensité, file_path):
+        """Colorimetry and plot for an already parsed spectrum."""
+        try:
+            # Colorimetry (XYZ, Lab, CRI) runs on the worker pool; the plot
+            # below is drawn right away.
+            self._start_colorimetry(longueur_onde, intensité, file_path)
 
-                # Calculate XYZ (CIE 1931 2 Degree Standard Observer)
-                XYZ = colour.sd_to_XYZ(sd)
-                X, Y, Z = XYZ
-                
-                # Calculate Lab (using D65 as reference)
-                # colour.XYZ_to_Lab expects XYZ in domain [0, 1] usually (relative to reference white Y=1)
-                Lab = colour.XYZ_to_Lab(XYZ / 100.0)
-                L, a, b_val = Lab
-                
-                # Calculate sRGB
-                # XYZ_to_sRGB expects XYZ in domain [0, 1] usually.
-                RGB = colour.XYZ_to_sRGB(XYZ / 100.0)
-                R, G, B = RGB
-                R_disp = int(np.clip(R, 0, 1) * 255)
-                G_disp = int(np.clip(G, 0, 1) * 255)
-                B_disp = int(np.clip(B, 0, 1) * 255)
-                
-                # Calculate CRI
-                cri_res = colour.quality.colour_rendering_index(sd, additional_data=True)
-                Ra = cri_res.Q_a
-                r_values = {k: v.Q_a for k, v in cri_res.Q_as.items()}
-                
-                # Update UI
-                self.color_patch.setStyleSheet(f"background-color: rgb({R_disp}, {G_disp}, {B_disp}); border: 1px solid #9aa5b1; border-radius: 5px;")
-                self.color_values_label.setText(f"XYZ: {X:.2f} {Y:.2f} {Z:.2f}\n"
-                                                f"RGB: {R_disp} {G_disp} {B_disp}\n"
-                                                f"Lab: {L:.2f} {a:.2f} {b_val:.2f}")
-                self._update_cie_point(X, Y, Z)
-                
-                self.cri_label.setText(f"CRI (Ra): {Ra:.1f}")
-
-                full_lines = [
-                    f"XYZ: {X:.2f} {Y:.2f} {Z:.2f}",
-                    f"RGB: {R_disp} {G_disp} {B_disp}",
-                    f"Lab: {L:.2f} {a:.2f} {b_val:.2f}",
-                    f"CRI (Ra): {Ra:.1f}",
-                    "",
-                    "-- Indices CRI --",
-                ]
-                for i in range(1, 16):
-                    full_lines.append(f"R{i}: {r_values.get(i, 0):.1f}")
-                self.cri_details.setPlainText("\n".join(full_lines))
-
-            except Exception as e:
-                self.console_output.append(f"Colorimetry Calc Error: {e}")
-                # import traceback
-                # traceback.print_exc()
-            # -------------------------------
-
-            self.ax.clear()
             y_max = float(np.max(intensité)) if len(intensité) else 1.0
             y_max = max(y_max, 1e-9)
-
-            # Continuous spectral gradient background (true gradient, not discrete patches)
             x_min = float(np.min(longueur_onde))
             x_max = float(np.max(longueur_onde))
-            grad_wl = np.linspace(x_min, x_max, 512)
-            grad_rgb = np.array([wavelength_to_rgb(wl) for wl in grad_wl], dtype=float)
-            grad_img = np.repeat(grad_rgb[np.newaxis, :, :], 2, axis=0)
-            self.ax.imshow(
-                grad_img,
-                extent=[x_min, x_max, 0.0, y_max],
-                aspect='auto',
-                origin='lower',
-                alpha=0.35,
-                zorder=0,
-                interpolation='bicubic'
-            )
+            file_name = Path(file_path).name
+            title = f'Spectre : {file_name}'
 
             # Plot spectral curve with polished style
-            self.ax.plot(longueur_onde, intensité, color='#102a43', linewidth=2.2, zorder=3)
-            self.ax.fill_between(longueur_onde, intensité, 0, color='#486581', alpha=0.08, zorder=2)
-
-            # Professional axes / typography
-            self.ax.set_facecolor('#ffffff')
-            self.ax.set_xlabel('Longueur d\'onde (nm)', fontsize=11, color='#243b53', labelpad=8)
-            self.ax.set_ylabel('Intensité relative', fontsize=11, color='#243b53', labelpad=8)
-            file_name = os.path.basename(file_path)
-            self.ax.set_title(f'Spectre : {file_name}', fontsize=13, color='#102a43', pad=10, fontweight='600')
-            self.ax.tick_params(axis='both', which='major', labelsize=9, colors='#334e68')
-            self.ax.tick_params(axis='x', which='both', bottom=True, top=False, labelbottom=True)
-            self.ax.grid(True, which='major', color='#d9e2ec', linewidth=0.8, alpha=0.7)
-            self.ax.grid(True, which='minor', color='#e9eff5', linewidth=0.5, alpha=0.55)
-            self.ax.minorticks_on()
-            self.ax.set_xlim(x_min, x_max)
-            self.ax.set_ylim(0.0, y_max * 1.05)
-            self.ax.set_box_aspect(1)
+            self._spectrum_line.set_data(longueur_onde, intensité)
+            self._spectrum_fill.set_data(longueur_onde, intensité, 0)
+
+            view = (x_min, x_max, y_max, title)
+            if view == self._spectrum_view and self._spectrum_bg is not None:
+                # Same limits, gradient and title: only the curve changed, so
+                # restore the cached axes and redraw just the animated artists.
+                self._blit_spectrum()
+                return
 
-            for spine in ['top', 'right']:
-                self.ax.spines[spine].set_visible(False)
-            for spine in ['left', 'bottom']:
-                self.ax.spines[spine].set_color('#9fb3c8')
-                self.ax.spines[spine].set_linewidth(1.0)
+            # Continuous spectral gradient background (true gradient, not discrete patches)
+            self._spectrum_image.set_data(_spectrum_gradient(x_min, x_max))
+            self._spectrum_image.set_extent([x_min, x_max, 0.0, y_max])
+            self._spectrum_image.set_visible(True)
 
-            self.canvas.figure.subplots_adjust(left=0.09, right=0.995, bottom=0.12, top=0.935)
+            self.ax.set_title(title, fontsize=13, color='#102a43', pad=10, fontweight='600')
+            self.ax.set_xlim(x_min, x_max)
+            self.ax.set_ylim(0.0, y_max * 1.05)
+            self._spectrum_view = view
             self.canvas.draw()
             
         except Exception as e:
-            self.console_output.append(f"Error plotting: {e}")
+            self._log(f"Error plotting: {e}")
             import traceback
             traceback.print_exc()
 
+    def _colorimetry_key(self, file_path):
+        """Identifies a spectrum file version: path + mtime + size (None if not cacheable)."""
+        path = os.path.abspath(file_path)
+        if path == os.path.abspath(self.temp_file):
+            return None  # rewritten by every measurement
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return f"{path}:{st.st_mtime_ns}:{st.st_size}"
+
+    def _colorimetry_cache_entries(self):
+        if self._colorimetry_cache is None:
+            entries = {}
+            try:
+                with open(self.colorimetry_cache_file, "r", encoding="utf-8") as f:
+                    for key, result in json.load(f).items():
+                        # JSON object keys are strings
+                        result["R"] = {int(k): v for k, v in result["R"].items()}
+                        entries[key] = result
+            except (OSError, ValueError, AttributeError, KeyError, TypeError):
+                entries = {}
+            self._colorimetry_cache = entries
+        return self._colorimetry_cache
+
+    def _store_colorimetry(self, key, result):
+        cache = self._colorimetry_cache_entries()
+        cache.pop(key, None)
+        cache[key] = result
+        while len(cache) > _COLORIMETRY_CACHE_MAX:
+            del cache[next(iter(cache))]
+        self._colorimetry_save_timer.start()
+
+    def _save_colorimetry_cache(self):
+        self._colorimetry_save_timer.stop()
+        if self._colorimetry_cache is None:
+            return
+        tmp = f"{self.colorimetry_cache_file}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._colorimetry_cache, f, separators=(",", ":"), ensure_ascii=False)
+            os.replace(tmp, self.colorimetry_cache_file)
+        except OSError:
+            pass
+
+    def closeEvent(self, event):
+        if self._colorimetry_save_timer.isActive():
+            self._save_colorimetry_cache()
+        super().closeEvent(event)
+
+    def _start_colorimetry(self, longueur_onde, intensité, file_path):
+        self._colorimetry_job += 1
+        key = self._colorimetry_key(file_path)
+        cache = self._colorimetry_cache_entries()
+        cached = cache.get(key) if key else None
+        if cached is not None:
+            # Same file as an earlier session: no SpectralDistribution, no CRI.
+            # Moved to the end so eviction drops the least recently used.
+            cache[key] = cache.pop(key)
+            self._colorimetry_save_timer.start()
+            self._apply_colorimetry(self._colorimetry_job, cached)
+            return
+        task = ColorimetryTask(self._colorimetry_job, longueur_onde, intensité)
+        task.signals.result_ready.connect(self._apply_colorimetry)
+        self._colorimetry_tasks[self._colorimetry_job] = (task, key)
+        self._worker_pool.start(task)
+
+    def _apply_colorimetry(self, job, result):
+        _task, key = self._colorimetry_tasks.pop(job, (None, None))
+        if job != self._colorimetry_job:
+            return  # a newer spectrum (or a live reading) has been shown since
+        if isinstance(result, Exception):
+            self._log(f"Colorimetry Calc Error: {result}")
+            return
+        if key is not None:
+            self._store_colorimetry(key, result)
+
+        X, Y, Z = result["XYZ"]
+        L, a, b_val = result["Lab"]
+        R_disp, G_disp, B_disp = result["RGB"]
+        Ra = result["Ra"]
+        r_values = result["R"]
+
+        # Update UI
+        self.color_patch.setStyleSheet(f"background-color: rgb({R_disp}, {G_disp}, {B_disp}); border: 1px solid #9aa5b1; border-radius: 5px;")
+        self.color_values_label.setText(f"XYZ: {X:.2f} {Y:.2f} {Z:.2f}\n"
+                                        f"RGB: {R_disp} {G_disp} {B_disp}\n"
+                                        f"Lab: {L:.2f} {a:.2f} {b_val:.2f}")
+        self._update_cie_point(X, Y, Z)
+
+        self.cri_label.setText(f"CRI (Ra): {Ra:.1f}")
+
+        full_lines = [
+            f"XYZ: {X:.2f} {Y:.2f} {Z:.2f}",
+            f"RGB: {R_disp} {G_disp} {B_disp}",
+            f"Lab: {L:.2f} {a:.2f} {b_val:.2f}",
+            f"CRI (Ra): {Ra:.1f}",
+            "",
+            "-- Indices CRI --",
+        ]
+        for i in range(1, 16):
+            full_lines.append(f"R{i}: {r_values.get(i, 0):.1f}")
+        self.cri_details.setPlainText("\n".join(full_lines))
+
+    def _init_spectrum_axes(self):
+        """Style the spectrum axes once and create the artists updated per file.
+
+        The curve and its fill are animated: they are left out of the cached
+        background and drawn on top of it by _on_spectrum_draw / _blit_spectrum.
+        """
+        self._spectrum_image = self.ax.imshow(
+            np.zeros((1, 2, 3)),
+            extent=[0.0, 1.0, 0.0, 1.0],
+            aspect='auto',
+            origin='lower',
+            alpha=0.35,
+            zorder=0,
+            interpolation='bilinear'
+        )
+        self._spectrum_image.set_visible(False)  # until the first spectrum
+        self._spectrum_line, = self.ax.plot([], [], color='#102a43', linewidth=2.2, zorder=3, animated=True)
+        self._spectrum_fill = self.ax.fill_between([], [], 0, color='#486581', alpha=0.08, zorder=2, animated=True)
+
+        # Professional axes / typography
+        self.ax.set_facecolor('#ffffff')
+        self.ax.set_xlabel('Longueur d\'onde (nm)', fontsize=11, color='#243b53', labelpad=8)
+        self.ax.set_ylabel('Intensité relative', fontsize=11, color='#243b53', labelpad=8)
+        self.ax.tick_params(axis='both', which='major', labelsize=9, colors='#334e68')
+        self.ax.tick_params(axis='x', which='both', bottom=True, top=False, labelbottom=True)
+        self.ax.grid(True, which='major', color='#d9e2ec', linewidth=0.8, alpha=0.7)
+        self.ax.grid(True, which='minor', color='#e9eff5', linewidth=0.5, alpha=0.55)
+        self.ax.minorticks_on()
+        self.ax.set_box_aspect(1)
+
+        for spine in ['top', 'right']:
+            self.ax.spines[spine].set_visible(False)
+        for spine in ['left', 'bottom']:
+            self.ax.spines[spine].set_color('#9fb3c8')
+            self.ax.spines[spine].set_linewidth(1.0)
+
+        self.canvas.figure.subplots_adjust(left=0.09, right=0.995, bottom=0.12, top=0.935)
+        self.canvas.mpl_connect('draw_event', self._on_spectrum_draw)
+
+    def _spectrum_animated_artists(self):
+        return (self._spectrum_fill, self._spectrum_line)
+
+    def _on_spectrum_draw(self, event):
+        """After every full draw, cache the background and paint the curve."""
+        if not self._spectrum_line.get_animated():
+            return
+        self._spectrum_bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self._spectrum_animated_artists():
+            self.ax.draw_artist(artist)
+
+    def _blit_spectrum(self):
+        self.canvas.restore_region(self._spectrum_bg)
+        for artist in self._spectrum_animated_artists():
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
+
     def save_plot(self):
         file_path, _ = QFileDialog.getSaveFileName(self, 'Save File', '', 'PNG Files (*.png);;All Files (*)')
         if file_path:
@@ -1600,7 +2513,12 @@ class SpectrumPlotter(QMainWindow):
             self.ax.set_ylabel('Intensité relative', fontsize=18)
             self.ax.title.set_fontsize(22)
             self.ax.tick_params(axis='both', which='major', labelsize=14)
+            # Animated artists are skipped by savefig; render them normally here.
+            for artist in self._spectrum_animated_artists():
+                artist.set_animated(False)
             self.canvas.figure.savefig(file_path, dpi=300)
+            for artist in self._spectrum_animated_artists():
+                artist.set_animated(True)
             self.canvas.figure.set_size_inches(original_size)
             self.canvas.figure.set_dpi(original_dpi)
             self.ax.set_xlabel('Longueur d\'onde (nm)', fontsize=11)
@@ -1608,7 +2526,7 @@ class SpectrumPlotter(QMainWindow):
             self.ax.title.set_fontsize(13)
             self.ax.tick_params(axis='both', which='major', labelsize=9)
             self.canvas.draw()
-            self.console_output.append(f'Plot saved as {file_path}')
+            self._log(f'Plot saved as {file_path}')
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
@@ -1,77 +1,78 @@
 import matplotlib.pyplot as plt
 import numpy as np
-import matplotlib.patches as patches
+from matplotlib.collections import PolyCollection
 import os
+from itertools import islice
 
 def wavelength_to_rgb(wavelength):
+    """Map wavelengths in nm (scalar or array) to RGB in [0, 1], shape (..., 3)."""
     gamma = 0.8
     intensity_max = 255
-    factor = 0.0
-    R = G = B = 0
+    w = np.asarray(wavelength, dtype=float)
+    out = np.zeros(w.shape + (3,))
+    R = out[..., 0]
+    G = out[..., 1]
+    B = out[..., 2]
 
-    if 380 <= wavelength < 440:
-        R = -(wavelength - 440) / (440 - 380)
-        G = 0.0
-        B = 1.0
-    elif 440 <= wavelength < 490:
-        R = 0.0
-        G = (wavelength - 440) / (490 - 440)
-        B = 1.0
-    elif 490 <= wavelength < 510:
-        R = 0.0
-        G = 1.0
-        B = -(wavelength - 510) / (510 - 490)
-    elif 510 <= wavelength < 580:
-        R = (wavelength - 510) / (580 - 510)
-        G = 1.0
-        B = 0.0
-    elif 580 <= wavelength < 645:
-        R = 1.0
-        G = -(wavelength - 645) / (645 - 580)
-        B = 0.0
-    elif 645 <= wavelength < 780:
-        R = 1.0
-        G = 0.0
-        B = 0.0
-    else:
-        R = G = B = 0.0
+    m = (380 <= w) & (w < 440)
+    R[m] = -(w[m] - 440) / (440 - 380)
+    B[m] = 1.0
+    m = (440 <= w) & (w < 490)
+    G[m] = (w[m] - 440) / (490 - 440)
+    B[m] = 1.0
+    m = (490 <= w) & (w < 510)
+    G[m] = 1.0
+    B[m] = -(w[m] - 510) / (510 - 490)
+    m = (510 <= w) & (w < 580)
+    R[m] = (w[m] - 510) / (580 - 510)
+    G[m] = 1.0
+    m = (580 <= w) & (w < 645)
+    R[m] = 1.0
+    G[m] = -(w[m] - 645) / (645 - 580)
+    m = (645 <= w) & (w < 780)
+    R[m] = 1.0
 
-    if 380 <= wavelength < 420:
-        factor = 0.3 + 0.7 * (wavelength - 380) / (420 - 380)
-    elif 420 <= wavelength < 645:
-        factor = 1.0
-    elif 645 <= wavelength < 780:
-        factor = 0.3 + 0.7 * (780 - wavelength) / (780 - 645)
-    else:
-        factor = 0.0
+    factor = np.zeros_like(w)
+    m = (380 <= w) & (w < 420)
+    factor[m] = 0.3 + 0.7 * (w[m] - 380) / (420 - 380)
+    factor[(420 <= w) & (w < 645)] = 1.0
+    m = (645 <= w) & (w < 780)
+    factor[m] = 0.3 + 0.7 * (780 - w[m]) / (780 - 645)
 
-    R = int(intensity_max * ((R * factor) ** gamma))
-    G = int(intensity_max * ((G * factor) ** gamma))
-    B = int(intensity_max * ((B * factor) ** gamma))
-
-    return (R / 255.0, G / 255.0, B / 255.0)
+    out *= factor[..., np.newaxis]
+    np.power(out, gamma, out=out)
+    out *= intensity_max
+    np.floor(out, out=out)
+    out /= 255.0
+    return out
 
 def plot_spectrum(file_path):
-    # Load data
+    # Load data: stop reading after line 19, the rest of the file is not used
     with open(file_path, 'r') as file:
-        data = file.readlines()
+        data = list(islice(file, 19))
         longueur_onde = data[13]
         intensité = data[18]
 
-    longueur_onde = longueur_onde.split()
-    intensité = intensité.split()
-    longueur_onde = [i.replace('SPEC_', '') for i in longueur_onde]
-    longueur_onde = np.array(longueur_onde, dtype=float)
-    intensité = np.array(intensité, dtype=float)
+    longueur_onde = np.fromstring(longueur_onde.replace('SPEC_', ''), sep=' ')
+    intensité = np.fromstring(intensité, sep=' ')
 
     # Create the plot with a 3:2 aspect ratio and higher resolution
     fig, ax = plt.subplots(figsize=(15, 10), dpi=200)
 
-    # Add color patches for each wavelength interval
-    for i in range(len(longueur_onde) - 1):
-        color = wavelength_to_rgb(longueur_onde[i])
-        rect = patches.Rectangle((longueur_onde[i], 0), longueur_onde[i+1] - longueur_onde[i], max(intensité), color=color, alpha=0.3)
-        ax.add_patch(rect)
+    # Add color patches for each wavelength interval, as one collection with
+    # a ready-made RGBA array (alpha baked in, no edge stroking)
+    ymax = float(intensité.max())
+    x0 = longueur_onde[:-1]
+    x1 = longueur_onde[1:]
+    verts = np.empty((len(x0), 4, 2), dtype=np.float32)
+    verts[:, 0, 0] = verts[:, 1, 0] = x0
+    verts[:, 2, 0] = verts[:, 3, 0] = x1
+    verts[:, 0, 1] = verts[:, 3, 1] = 0
+    verts[:, 1, 1] = verts[:, 2, 1] = ymax
+    facecolors = np.empty((len(x0), 4), dtype=np.float32)
+    facecolors[:, :3] = wavelength_to_rgb(x0)
+    facecolors[:, 3] = 0.3
+    ax.add_collection(PolyCollection(verts, facecolors=facecolors, edgecolors='none', linewidths=0))
 
     # Plot the data
     ax.plot(longueur_onde, intensité, color='black')
@@ -1,22 +1,14 @@
 import matplotlib.pyplot as plt
 import numpy as np
+from itertools import islice
 
-# charger la ligne 14 du document Filament.sp comme un long string
+# charger les lignes 14 et 19 du document Filament.sp (on s'arrête à la 19e)
 with open('../Filament.sp', 'r') as file:
-    data = file.readlines()
-    longueur_onde = data[13]
-    intensité = data[18]
+    data = list(islice(file, 19))
 
-#utiliser les espace pour transformer le string en liste
-longueur_onde = longueur_onde.split()
-intensité = intensité.split()
-
-#remove "SPEC_" from each entry on the list
-longueur_onde = [i.replace('SPEC_', '') for i in longueur_onde]
-
-#convert the list to a numpy array
-longueur_onde = np.array(longueur_onde, dtype=float)
-intensité = np.array(intensité, dtype=float)
+#enlever "SPEC_" sur toute la ligne puis convertir directement en numpy array
+longueur_onde = np.fromstring(data[13].replace('SPEC_', ''), sep=' ')
+intensité = np.fromstring(data[18], sep=' ')
 print(longueur_onde)
 print(intensité)
 
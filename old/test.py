@@ -1,84 +1,127 @@
 import sys
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QPushButton, QWidget, QFileDialog, QLabel
 from PyQt6.QtCore import Qt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
 import numpy as np
 import os
-import matplotlib.patches as patches
+from itertools import islice
+from functools import lru_cache
+
+# matplotlib is imported on the first plot, see _get_canvas()
+FigureCanvas = None
+Figure = None
+
+def _get_canvas():
+    global FigureCanvas, Figure
+    if FigureCanvas is None:
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+    return FigureCanvas
 
 def wavelength_to_rgb(wavelength):
+    """Map wavelengths in nm (scalar or array) to RGB in [0, 1], shape (..., 3)."""
     gamma = 0.8
     intensity_max = 255
-    factor = 0.0
-    R = G = B = 0
-
-    if 380 <= wavelength < 440:
-        R = -(wavelength - 440) / (440 - 380)
-        G = 0.0
-        B = 1.0
-    elif 440 <= wavelength < 490:
-        R = 0.0
-        G = (wavelength - 440) / (490 - 440)
-        B = 1.0
-    elif 490 <= wavelength < 510:
-        R = 0.0
-        G = 1.0
-        B = -(wavelength - 510) / (510 - 490)
-    elif 510 <= wavelength < 580:
-        R = (wavelength - 510) / (580 - 510)
-        G = 1.0
-        B = 0.0
-    elif 580 <= wavelength < 645:
-        R = 1.0
-        G = -(wavelength - 645) / (645 - 580)
-        B = 0.0
-    elif 645 <= wavelength < 780:
-        R = 1.0
-        G = 0.0
-        B = 0.0
-    else:
-        R = G = B = 0.0
-
-    if 380 <= wavelength < 420:
-        factor = 0.3 + 0.7 * (wavelength - 380) / (420 - 380)
-    elif 420 <= wavelength < 645:
-        factor = 1.0
-    elif 645 <= wavelength < 780:
-        factor = 0.3 + 0.7 * (780 - wavelength) / (780 - 645)
-    else:
-        factor = 0.0
-
-    R = int(intensity_max * ((R * factor) ** gamma))
-    G = int(intensity_max * ((G * factor) ** gamma))
-    B = int(intensity_max * ((B * factor) ** gamma))
-
-    return (R / 255.0, G / 255.0, B / 255.0)
-
-def plot_spectrum(file_path):
-    # Load data
+    w = np.asarray(wavelength, dtype=float)
+    out = np.zeros(w.shape + (3,))
+    R = out[..., 0]
+    G = out[..., 1]
+    B = out[..., 2]
+
+    m = (380 <= w) & (w < 440)
+    R[m] = -(w[m] - 440) / (440 - 380)
+    B[m] = 1.0
+    m = (440 <= w) & (w < 490)
+    G[m] = (w[m] - 440) / (490 - 440)
+    B[m] = 1.0
+    m = (490 <= w) & (w < 510)
+    G[m] = 1.0
+    B[m] = -(w[m] - 510) / (510 - 490)
+    m = (510 <= w) & (w < 580)
+    R[m] = (w[m] - 510) / (580 - 510)
+    G[m] = 1.0
+    m = (580 <= w) & (w < 645)
+    R[m] = 1.0
+    G[m] = -(w[m] - 645) / (645 - 580)
+    m = (645 <= w) & (w < 780)
+    R[m] = 1.0
+
+    factor = np.zeros_like(w)
+    m = (380 <= w) & (w < 420)
+    factor[m] = 0.3 + 0.7 * (w[m] - 380) / (420 - 380)
+    factor[(420 <= w) & (w < 645)] = 1.0
+    m = (645 <= w) & (w < 780)
+    factor[m] = 0.3 + 0.7 * (780 - w[m]) / (780 - 645)
+
+    out *= factor[..., np.newaxis]
+    np.power(out, gamma, out=out)
+    out *= intensity_max
+    np.floor(out, out=out)
+    out /= 255.0
+    return out
+
+# wavelength_to_rgb sampled at every integer nm of the visible range
+_WAVELENGTH_LUT = wavelength_to_rgb(np.arange(380, 781)).astype(np.float32)
+
+def wavelength_to_rgb_lut(wavelength):
+    """Same mapping as wavelength_to_rgb, looked up in _WAVELENGTH_LUT with linear interpolation."""
+    w = np.asarray(wavelength, dtype=float)
+    idx = np.clip(w - 380, 0, 400)
+    lo = np.minimum(idx.astype(int), 399)
+    frac = (idx - lo).astype(np.float32)[..., np.newaxis]
+    colors = (1 - frac) * _WAVELENGTH_LUT[lo] + frac * _WAVELENGTH_LUT[lo + 1]
+    colors[(w < 380) | (w >= 780)] = 0.0
+    return colors
+
+@lru_cache(maxsize=16)
+def _load_spectrum(file_path, mtime):
+    # Load data: only lines 14 (wavelengths) and 19 (intensities) are needed
     with open(file_path, 'r') as file:
-        data = file.readlines()
-        longueur_onde = data[13]
-        intensité = data[18]
-
-    longueur_onde = longueur_onde.split()
-    intensité = intensité.split()
-    longueur_onde = [i.replace('SPEC_', '') for i in longueur_onde]
-    longueur_onde = np.array(longueur_onde, dtype=float)
-    intensité = np.array(intensité, dtype=float)
-
-    # Create the plot with a 3:2 aspect ratio and higher resolution
-    fig, ax = plt.subplots(figsize=(15, 10), dpi=200)
-
-    # Add color patches for each wavelength interval
-    for i in range(len(longueur_onde) - 1):
-        color = wavelength_to_rgb(longueur_onde[i])
-        rect = patches.Rectangle((longueur_onde[i], 0), longueur_onde[i+1] - longueur_onde[i], max(intensité), color=color, alpha=0.3)
-        ax.add_patch(rect)
-
-    # Plot the data
-    ax.plot(longueur_onde, intensité, color='black')
+        data = list(islice(file, 19))
+
+    longueur_onde = np.fromstring(data[13].replace('SPEC_', ''), sep=' ')
+    intensité = np.fromstring(data[18], sep=' ')
+    background = spectrum_background(longueur_onde)
+    # Shared between calls through the cache
+    for array in (longueur_onde, intensité, background):
+        array.setflags(write=False)
+    return longueur_onde, intensité, background
+
+def load_spectrum(file_path):
+    """Wavelengths, intensities and background strip of a .sp file, cached until the file changes."""
+    return _load_spectrum(file_path, os.path.getmtime(file_path))
+
+def spectrum_background(longueur_onde):
+    # Spectrum background: a single 1xN RGBA strip instead of one artist per
+    # interval. Wavelength steps can be irregular, so each column of a uniform
+    # grid takes the colour of the interval it falls in.
+    colors = wavelength_to_rgb_lut(longueur_onde[:-1])
+    grid = np.linspace(longueur_onde[0], longueur_onde[-1], 1024)
+    seg = np.clip(np.searchsorted(longueur_onde, grid, side='right') - 1, 0, len(colors) - 1)
+    rgba = np.empty((1, len(grid), 4), dtype=np.float32)
+    rgba[0, :, :3] = colors[seg]
+    rgba[0, :, 3] = 0.3
+    return rgba
+
+def line_points(longueur_onde, intensité, max_points=5000):
+    """Points actually stroked for the intensity trace, decimated for very dense spectra."""
+    step = len(longueur_onde) // max_points
+    if step > 1:
+        return longueur_onde[::step], intensité[::step]
+    return longueur_onde, intensité
+
+def plot_spectrum(file_path, ax):
+    longueur_onde, intensité, background = load_spectrum(file_path)
+
+    ymax = float(intensité.max())
+    image = ax.imshow(background,
+                      extent=[longueur_onde[0], longueur_onde[-1], 0, ymax],
+                      aspect='auto', origin='lower', interpolation='nearest', zorder=0)
+
+    # Plot the data; dense spectra are stroked without antialiasing, the
+    # coloured background already gives the visual context
+    line, = ax.plot(*line_points(longueur_onde, intensité), color='black',
+                    antialiased=len(longueur_onde) < 2000,
+                    solid_joinstyle='miter', solid_capstyle='butt')
 
     # Set labels and title with larger font size
     ax.set_xlabel('Longueur d\'onde (nm)', fontsize=20)
@@ -91,7 +134,7 @@ def plot_spectrum(file_path):
     # Increase tick parameters
     ax.tick_params(axis='both', which='major', labelsize=16)
 
-    return fig, ax
+    return image, line
 
 class SpectrumPlotter(QMainWindow):
     def __init__(self):
@@ -108,14 +151,22 @@ class SpectrumPlotter(QMainWindow):
         self.open_button.clicked.connect(self.open_file)
         self.layout.addWidget(self.open_button)
 
-        self.canvas = FigureCanvas(plt.Figure(figsize=(15, 10), dpi=200))
-        self.layout.addWidget(self.canvas)
+        # The canvas replaces this placeholder on the first file open
+        self.placeholder = QLabel('Aucun spectre chargé')
+        self.placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.layout.addWidget(self.placeholder)
+        self.canvas = None
+        self.ax = None
 
         self.save_button = QPushButton('Sauvegarder le graphique')
         self.save_button.clicked.connect(self.save_plot)
         self.layout.addWidget(self.save_button)
 
-        self.ax = self.canvas.figure.subplots()
+        # Blitting state: the image, line and title are animated, everything
+        # else (axes, ticks, labels) is cached in _bg after each full draw
+        self._artists = None
+        self._limits = None
+        self._bg = None
 
     def open_file(self):
         file_path, _ = QFileDialog.getOpenFileName(self, 'Open File', '', 'Spectre Files (*.sp);;All Files (*)')
@@ -123,16 +174,68 @@ class SpectrumPlotter(QMainWindow):
             self.plot_spectrum(file_path)
 
 
+    def _ensure_canvas(self):
+        if self.canvas is not None:
+            return
+        canvas_class = _get_canvas()
+        self.canvas = canvas_class(Figure(figsize=(15, 10), dpi=100))
+        self.layout.replaceWidget(self.placeholder, self.canvas)
+        self.placeholder.deleteLater()
+        self.ax = self.canvas.figure.subplots()
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
     def plot_spectrum(self, file_path):
-        fig, ax = plot_spectrum(file_path)
+        self._ensure_canvas()
+        longueur_onde, intensité, background = load_spectrum(file_path)
+        limits = (longueur_onde[0], longueur_onde[-1], float(intensité.max()))
+        if self._bg is not None and limits == self._limits:
+            # Same axis limits: only the data artists and the title change
+            image, line = self._artists
+            image.set_data(background)
+            line.set_data(*line_points(longueur_onde, intensité))
+            line.set_antialiased(len(longueur_onde) < 2000)
+            self.ax.set_title(f'Spectre : {os.path.basename(file_path)}', fontsize=24)
+            self.canvas.restore_region(self._bg)
+            self._draw_artists()
+            self.canvas.blit(self.canvas.figure.bbox)
+            return
+
         self.ax.clear()
-        self.ax = ax
-        self.canvas.draw()
+        self._artists = plot_spectrum(file_path, self.ax)
+        for artist in self._animated():
+            artist.set_animated(True)
+        self._limits = limits
+        self._bg = None
+        # Pick up the new data bounds in the same scheduled draw
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.canvas.draw_idle()
+
+    def _animated(self):
+        return (*self._artists, self.ax.title) if self._artists else ()
+
+    def _draw_artists(self):
+        for artist in self._animated():
+            self.ax.draw_artist(artist)
+        # Keep the frame on top of the background image
+        for spine in self.ax.spines.values():
+            self.ax.draw_artist(spine)
+
+    def _on_draw(self, event):
+        if self._artists:
+            self._bg = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+            self._draw_artists()
 
     def save_plot(self):
         file_path, _ = QFileDialog.getSaveFileName(self, 'Save File', '', 'PNG Files (*.png);;All Files (*)')
-        if file_path:
-            self.canvas.figure.savefig(file_path)
+        if file_path and self.canvas is not None:
+            # Animated artists are skipped by savefig, include them for the export
+            for artist in self._animated():
+                artist.set_animated(False)
+            # On-screen canvas is 100 dpi; keep print quality for the export
+            self.canvas.figure.savefig(file_path, dpi=200)
+            for artist in self._animated():
+                artist.set_animated(True)
             print(f'Plot saved as {file_path}')
 
 if __name__ == '__main__':